@@ -0,0 +1,107 @@
+"""
+fpit - Headless compute API of the FPIT simulations
+
+A lazy facade over the package modules: `from fpit import simulate_delta_h`
+imports fpit.weak_coupling_critical_phase on first access only, so
+importing fpit itself costs next to nothing and pulls in neither NumPy,
+SciPy nor matplotlib. The modules themselves do no work at import time
+either; matplotlib, seaborn and QuTiP load only inside the figure
+producers and the optional backends. Whole modules are reachable too,
+e.g. fpit.geodesic_basins. Where a function shares its module's name
+(constraint_tensor, lindblad_sparse, lisa_sensitivity, monte_carlo)
+fpit.<name> is the module, as for any submodule; the function is
+fpit.monte_carlo.monte_carlo and so on.
+"""
+
+import importlib
+
+# Submodules of the package
+MODULES = (
+    '_deps', 'adaptive_mesh_refinement', 'analysis', 'anec_integration',
+    'anec_proof', 'constraint_tensor', 'convergence_study', 'critical_point',
+    'decoherence_vs_lambda', 'energy_threshold',
+    'exotic_matter_phase_diagram', 'figures', 'geodesic_basins',
+    'gw_waveform', 'instrumentation', 'lindblad_sparse', 'lisa_sensitivity',
+    'matched_filter', 'metric_rigidity', 'monte_carlo',
+    'multi_fpit_interference', 'plotting', 'qecc_analogy', 'result_cache',
+    'scaling_benchmark', 'snapshots', 'weak_coupling_critical_phase',
+)
+
+# Public name -> defining module
+_API = {
+    # Metric perturbation solvers
+    'simulate_delta_h': 'weak_coupling_critical_phase',
+    'simulate_delta_h_batch': 'weak_coupling_critical_phase',
+    'simulate_delta_h_nd': 'weak_coupling_critical_phase',
+    'integrate_delta_h_cn': 'weak_coupling_critical_phase',
+    'integrate_delta_h_euler': 'weak_coupling_critical_phase',
+    'laplacian_operator': 'weak_coupling_critical_phase',
+    'simulate_delta_h_amr': 'adaptive_mesh_refinement',
+    'locate_lambda_crit': 'critical_point',
+    'euler_lambda_limit': 'critical_point',
+    'estimate_lambda_crit': 'critical_point',
+    'run_study': 'convergence_study',
+    'convergence_table': 'convergence_study',
+    # Decoherence
+    'theoretical_decay': 'decoherence_vs_lambda',
+    'liouvillian': 'decoherence_vs_lambda',
+    'lindblad_batch': 'decoherence_vs_lambda',
+    'lindblad_simulation': 'decoherence_vs_lambda',
+    'fit_decay_batch': 'decoherence_vs_lambda',
+    'bootstrap_decay_fit': 'decoherence_vs_lambda',
+    'sparse_liouvillian': 'lindblad_sparse',
+    'local_operator': 'lindblad_sparse',
+    'fpit_channels': 'lindblad_sparse',
+    # Constraint tensor
+    'killing_residual': 'constraint_tensor',
+    'killing_violation': 'constraint_tensor',
+    'noether_charge': 'energy_threshold',
+    'charge_flux': 'energy_threshold',
+    'e_min': 'energy_threshold',
+    'e_min_sweep': 'energy_threshold',
+    # Energy conditions and exotic matter
+    'energy_density': 'anec_proof',
+    'anec_integral': 'anec_integration',
+    'register_potential': 'exotic_matter_phase_diagram',
+    'phase_diagram': 'exotic_matter_phase_diagram',
+    # Geodesics and interference
+    'integrate_geodesics': 'geodesic_basins',
+    'basin_map': 'geodesic_basins',
+    'multi_fpit_interaction': 'multi_fpit_interference',
+    'multi_fpit_field': 'multi_fpit_interference',
+    'grid_points': 'multi_fpit_interference',
+    # Gravitational waves
+    'fpit_burst': 'gw_waveform',
+    'bbh_chirp': 'gw_waveform',
+    'noise_psd': 'lisa_sensitivity',
+    'snr_map': 'lisa_sensitivity',
+    'detectability': 'lisa_sensitivity',
+    'template_bank': 'matched_filter',
+    'search': 'matched_filter',
+    # Statistics
+    'RunningStats': 'monte_carlo',
+    'trial_statistics': 'metric_rigidity',
+    # Infrastructure
+    'cached': 'result_cache',
+    'configure_cache': 'result_cache',
+    'SnapshotWriter': 'snapshots',
+    'read_snapshots': 'snapshots',
+}
+
+__all__ = sorted(_API)
+
+
+def __getattr__(name):
+    if name in _API:
+        value = getattr(importlib.import_module(f".{_API[name]}", __name__),
+                        name)
+    elif name in MODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module 'fpit' has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_API) | set(MODULES))
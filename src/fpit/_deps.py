@@ -0,0 +1,47 @@
+"""
+_deps.py - Source location and local import graph of the package modules
+
+Shared by figures (incremental rebuilds) and result_cache (cache keys), so
+that neither has to import the other.
+"""
+
+import os
+
+from . import MODULES
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def module_path(module):
+    return os.path.join(PACKAGE_DIR, f"{module}.py")
+
+
+def _local_imports(module):
+    """Names of package modules imported by `module`"""
+    import ast
+    with open(module_path(module), encoding='utf-8') as f:
+        tree = ast.parse(f.read())
+    names = set()
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.ImportFrom):
+            continue
+        if node.level == 1 or node.module == __package__:
+            # from . import x / from .x import y / from fpit import x
+            if node.module and node.level:
+                names.add(node.module.split('.')[0])
+            else:
+                names.update(alias.name for alias in node.names)
+        elif node.module and node.module.startswith(f"{__package__}."):
+            names.add(node.module.split('.')[1])
+    return names.intersection(MODULES)
+
+
+def local_dependencies(module):
+    """`module` and every package module it imports, transitively"""
+    seen, stack = set(), [module]
+    while stack:
+        current = stack.pop()
+        if current not in seen:
+            seen.add(current)
+            stack.extend(_local_imports(current) - seen)
+    return sorted(seen)
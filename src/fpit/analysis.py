@@ -1,11 +1,11 @@
 import numpy as np
-import matplotlib.pyplot as plt
-from scipy.integrate import odeint
+
+from .plotting import pyplot
 
 # =================================================================
 # LaTeX Setup for arXiv Publication Quality
 # =================================================================
-plt.rcParams.update({
+RC_PARAMS = {
     'text.usetex': True,
     'font.family': 'serif',
     'font.serif': ['Times New Roman'],
@@ -20,14 +20,15 @@ plt.rcParams.update({
     'savefig.format': 'pdf',
     'savefig.bbox': 'tight',
     'text.latex.preamble': r'\usepackage{amsmath,amssymb,physics}'
-})
+}
 
 # =================================================================
 # Figure 1: Geodesic Convergence and Metric Suppression
 # =================================================================
 
 
-def create_figure1():
+def create_figure1(save_path='figure1.pdf'):
+    plt = pyplot(RC_PARAMS)
     # -------------------------
     # Figure 1a: Geodesic Convergence
     # -------------------------
@@ -39,6 +40,7 @@ def create_figure1():
         x, v = y
         return [v, -lambda0 * x * np.exp(-x**2)]
 
+    from scipy.integrate import odeint
     t = np.linspace(0, 5, 100)
     colors = plt.colormaps['viridis'](np.linspace(0, 1, 6))
     for i, x0 in enumerate([-2, -1.5, -1, 1, 1.5, 2]):
@@ -75,14 +77,15 @@ def create_figure1():
     ax1b.legend(loc='upper right')
 
     plt.tight_layout()
-    plt.savefig('figure1.pdf', dpi=300, bbox_inches='tight')
+    plt.savefig(save_path, dpi=300, bbox_inches='tight')
 
 # =================================================================
 # Figure 2: Exotic Matter and Wormhole Stability
 # =================================================================
 
 
-def create_figure2():
+def create_figure2(save_path='figure2.pdf'):
+    plt = pyplot(RC_PARAMS)
     fig2, (ax2a, ax2b) = plt.subplots(1, 2, figsize=(7.5, 3))
     fig2.suptitle(r'\textbf{Wormhole Dynamics}', y=1.02)
 
@@ -116,7 +119,7 @@ def create_figure2():
     ax2b.legend(loc='upper left')
 
     plt.tight_layout()
-    plt.savefig('figure2.pdf', dpi=300, bbox_inches='tight')
+    plt.savefig(save_path, dpi=300, bbox_inches='tight')
 
 
 # =================================================================
@@ -0,0 +1,157 @@
+"""
+anec_integration.py - Adaptive Gauss-Kronrod ANEC integrals over parameter batches
+
+Integrates the exotic energy density of anec_proof along null rays
+r(s) = sqrt(b² + s²) with impact parameter b (b = 0 is the radial ray of the
+original plot) for whole batches of (phi0, sigma, lam, b) at once. Each
+interval of the user's grid is integrated with the 7/15-point Gauss-Kronrod
+pair; intervals whose |K15 - G7| exceeds their share of the tolerance are
+bisected, and all pending intervals of all batch members are evaluated in
+one vectorised call per pass. The cumulative profile is exact (to the
+tolerance) at every grid point, unlike the first-order cumsum(rho)*dr.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from .anec_proof import phi0, sigma, lam, energy_density
+
+rtol = 1e-10      # Relative to the integral of |rho| over the grid
+atol = 1e-14
+max_passes = 40   # Bisection passes before giving up on an interval
+
+# Gauss-Kronrod 15-point nodes/weights on [-1, 1]; the 7-point Gauss rule
+# uses every other Kronrod node
+_xk = np.array([0.991455371120812639206854697526329,
+                0.949107912342758524526189684047851,
+                0.864864423359769072789712788640926,
+                0.741531185599394439863864773280788,
+                0.586087235467691130294144845693013,
+                0.405845151377397166906606412076961,
+                0.207784955007898467600689403773245,
+                0.0])
+_wk = np.array([0.022935322010529224963732008058970,
+                0.063092092629978553290700663189204,
+                0.104790010322250183839876322541518,
+                0.140653259715525918745189590510238,
+                0.169004726639267902826583426598550,
+                0.190350578064785409913256402421014,
+                0.204432940075298892414161999234649,
+                0.209482141084727828012999174891714])
+_wg = np.array([0.129484966168869693270611432679082,
+                0.279705391489276667901467771423780,
+                0.381830050505118944950369775488975,
+                0.417959183673469387755102040816327])
+NODES = np.concatenate((-_xk[:-1], _xk[::-1]))
+WK15 = np.concatenate((_wk[:-1], _wk[::-1]))
+WG7 = np.zeros(15)
+WG7[1:7:2], WG7[7], WG7[9:15:2] = _wg[:3], _wg[3], _wg[2::-1]
+
+ANECResult = namedtuple(
+    'ANECResult',
+    ['profile', 'total', 'error', 'evaluations', 'converged'])
+
+
+def null_ray_density(s, phi0, sigma, lam, b):
+    """Energy density along the null ray with impact parameter b"""
+    return energy_density(np.sqrt(b**2 + s**2), phi0, sigma, lam)
+
+
+def gauss_kronrod(f, a, b, params):
+    """K15 integral and |K15 - G7| error of f on [a, b], row-wise.
+
+    a, b are (n,) interval ends and params a tuple of (n,) arrays passed to
+    f as extra arguments.
+    """
+    mid, half = 0.5*(a + b), 0.5*(b - a)
+    x = mid[:, None] + half[:, None]*NODES
+    fx = f(x, *(p[:, None] for p in params))
+    K = half * (fx @ WK15)
+    G = half * (fx @ WG7)
+    return K, np.abs(K - G)
+
+
+def anec_integral(s, phi0=phi0, sigma=sigma, lam=lam, b=0.0,
+                  rtol=rtol, atol=atol, density=null_ray_density):
+    """Cumulative ANEC integral ∫_{s_0}^{s_k} rho ds for a parameter batch.
+
+    The parameters broadcast to a batch shape B; s is the common 1-D grid
+    whose intervals seed the adaptive partition. Returns an ANECResult with
+    profile (*B, len(s)), total, error estimate and density evaluations
+    (each *B), and whether every interval met its tolerance.
+    """
+    s = np.asarray(s, dtype=float)
+    params = np.broadcast_arrays(*(np.asarray(p, dtype=float)
+                                   for p in (phi0, sigma, lam, b)))
+    batch_shape = params[0].shape
+    params = [p.ravel() for p in params]
+    n_batch, n_int = params[0].size, len(s) - 1
+
+    # Active intervals: owning batch member, grid interval, ends
+    member = np.repeat(np.arange(n_batch), n_int)
+    interval = np.tile(np.arange(n_int), n_batch)
+    lo = np.tile(s[:-1], n_batch)
+    hi = np.tile(s[1:], n_batch)
+
+    pieces = np.zeros((n_batch, n_int))
+    error = np.zeros(n_batch)
+    evaluations = np.zeros(n_batch, dtype=np.int64)
+    converged = np.ones(n_batch, dtype=bool)
+    length = s[-1] - s[0]
+
+    scale = None
+    for n_pass in range(max_passes + 1):
+        K, err = gauss_kronrod(density, lo, hi,
+                               tuple(p[member] for p in params))
+        evaluations += 15 * np.bincount(member, minlength=n_batch)
+        if scale is None:
+            # Tolerance scale: ∫|rho| on the seed partition, per member
+            scale = np.bincount(member, weights=np.abs(K), minlength=n_batch)
+        tol = np.maximum(atol, rtol*scale[member]) * (hi - lo) / length
+        done = (err <= tol) | (n_pass == max_passes)
+        if n_pass == max_passes:
+            converged &= ~np.bincount(member[err > tol],
+                                      minlength=n_batch).astype(bool)
+
+        np.add.at(pieces, (member[done], interval[done]), K[done])
+        error += np.bincount(member[done], weights=err[done],
+                             minlength=n_batch)
+
+        keep = ~done
+        if not keep.any():
+            break
+        mid = 0.5*(lo[keep] + hi[keep])
+        member = np.repeat(member[keep], 2)
+        interval = np.repeat(interval[keep], 2)
+        lo, hi = (np.column_stack((lo[keep], mid)).ravel(),
+                  np.column_stack((mid, hi[keep])).ravel())
+
+    profile = np.zeros((n_batch, len(s)))
+    np.cumsum(pieces, axis=1, out=profile[:, 1:])
+    return ANECResult(profile.reshape(*batch_shape, len(s)),
+                      profile[:, -1].reshape(batch_shape),
+                      error.reshape(batch_shape),
+                      evaluations.reshape(batch_shape),
+                      converged.reshape(batch_shape))
+
+
+if __name__ == "__main__":
+    from .anec_proof import exotic_stress_energy_tensor
+
+    r = np.linspace(0, 5*sigma, 1000)
+    riemann = np.cumsum(exotic_stress_energy_tensor(r)) * (r[1] - r[0])
+    result = anec_integral(np.linspace(0, 5*sigma, 11))
+    print(f"ANEC integral: {result.total:.12f} ± {result.error:.1e} "
+          f"({result.evaluations} evaluations); "
+          f"Riemann sum on 1000 points: {riemann[-1]:.12f}")
+
+    # Parameter scan over couplings, widths and impact parameters
+    lam_grid, sigma_grid, b_grid = np.meshgrid(
+        np.linspace(0.5, 2.5, 50), np.linspace(0.5, 2.0, 40),
+        np.linspace(0, 3, 30), indexing='ij')
+    scan = anec_integral(np.linspace(0, 10, 21), phi0, sigma_grid,
+                         lam_grid, b_grid)
+    print(f"{scan.total.size} rays: max error {scan.error.max():.1e}, "
+          f"mean {scan.evaluations.mean():.0f} evaluations per ray, "
+          f"all converged: {scan.converged.all()}")
@@ -0,0 +1,130 @@
+"""
+critical_point.py - Adaptive λ_crit locator built on simulate_delta_h
+
+λ_crit is the smallest coupling at which the perturbation is stabilised,
+max|Δh| < threshold at the end of the run. Since the decay rate grows with λ
+the criterion is monotone, so each trial brackets the crossing and refines
+it with Brent's method: about log2(range/tol) solver calls instead of a
+uniform λ sweep. Trials start from independently perturbed initial
+conditions and run in parallel.
+
+Monotonicity only holds where the solver is stable: beyond the explicit
+Euler limit dt·(Γ + 4λφ0²) < 2 the 'euler' runs blow up and max|Δh| grows
+with λ again. The bracket is therefore never widened past that limit for
+method='euler'; 'cn' is unconditionally stable.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from .instrumentation import phase, count
+from .weak_coupling_critical_phase import (simulate_delta_h, sigma, phi0,
+                                           dt, N)
+
+threshold = 1e-3        # Stabilisation criterion on max|Δh|
+lambda_bracket = (0.01, 3.0)
+lambda_tol = 1e-3       # Absolute tolerance on λ_crit per trial
+
+CriticalPoint = namedtuple(
+    'CriticalPoint',
+    ['lambda_crit', 'std', 'ci_low', 'ci_high', 'samples', 'solver_calls'])
+
+
+def euler_lambda_limit(step=dt):
+    """Largest λ with a stable explicit Euler simulate_delta_h run.
+
+    Solves step·(√λ·φ0²/σ + 4λφ0²) = 2 (decay plus the largest eigenvalue
+    of the unscaled reflect-boundary Laplacian) for λ.
+    """
+    a, b = 4*phi0**2, phi0**2 / sigma
+    root = (-b + np.sqrt(b**2 + 8*a/step)) / (2*a)
+    return root**2
+
+
+def random_initial_condition(rng, amp_spread=0.2, shift_spread=0.5):
+    """Gaussian perturbation with random amplitude and centre"""
+    x = np.linspace(-5*sigma, 5*sigma, N)
+    amp = 0.1 * (1 + amp_spread * rng.standard_normal())
+    x0 = shift_spread * sigma * rng.standard_normal()
+    return amp * np.exp(-(x - x0)**2 / (2*sigma)**2)
+
+
+def _log_excess(lambda_val, h0, method, calls):
+    """log10(max|Δh| / threshold); negative once the run is stabilised"""
+    calls[0] += 1
+    _, h = simulate_delta_h(lambda_val, method=method, h0=h0)
+    return np.log10(max(np.max(np.abs(h)), 1e-300) / threshold)
+
+
+def locate_lambda_crit(h0=None, bracket=lambda_bracket, tol=lambda_tol,
+                       method='euler'):
+    """λ_crit for one initial condition; returns (λ_crit, solver calls).
+
+    The bracket is widened geometrically if it does not contain the
+    crossing; for method='euler' never past euler_lambda_limit().
+    """
+    calls = [0]
+    lo, hi = bracket
+    hi_max = euler_lambda_limit() if method == 'euler' else np.inf
+    if lo >= hi_max:
+        raise ValueError(f"Bracket starts above the Euler stability limit "
+                         f"λ = {hi_max:.4g}; use method='cn'")
+    hi = min(hi, hi_max)
+    f_lo = _log_excess(lo, h0, method, calls)
+    f_hi = _log_excess(hi, h0, method, calls)
+    for _ in range(20):
+        if f_lo > 0 > f_hi:
+            break
+        if f_lo <= 0:
+            lo /= 2
+            f_lo = _log_excess(lo, h0, method, calls)
+        elif hi < hi_max:
+            hi = min(2*hi, hi_max)
+            f_hi = _log_excess(hi, h0, method, calls)
+        else:
+            raise RuntimeError(
+                f"No stabilisation threshold below the Euler stability "
+                f"limit λ = {hi_max:.4g}; use method='cn' to search higher")
+    else:
+        raise RuntimeError(f"No stabilisation threshold in [{lo}, {hi}]")
+
+    from scipy.optimize import brentq
+    lam = brentq(_log_excess, lo, hi, args=(h0, method, calls), xtol=tol)
+    return lam, calls[0]
+
+
+def _trial(seed_seq, bracket, tol, method):
+    h0 = random_initial_condition(np.random.default_rng(seed_seq))
+    return locate_lambda_crit(h0, bracket, tol, method)
+
+
+def estimate_lambda_crit(n_trials=100, seed=None, n_workers=None,
+                         confidence=0.95, bracket=lambda_bracket,
+                         tol=lambda_tol, method='euler'):
+    """λ_crit over independent initial-condition trials, in parallel.
+
+    Returns a CriticalPoint with the mean, standard deviation and the
+    percentile confidence interval of the trial values.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    children = np.random.SeedSequence(seed).spawn(n_trials)
+    with phase('critical_point.trials', n_trials=n_trials), \
+            ProcessPoolExecutor(n_workers) as pool:
+        results = list(pool.map(_trial, children,
+                                 [bracket]*n_trials, [tol]*n_trials,
+                                 [method]*n_trials))
+    count('critical_point.solver_calls', sum(c for _, c in results))
+    samples = np.array([lam for lam, _ in results])
+    alpha = (1 - confidence) / 2
+    ci_low, ci_high = np.quantile(samples, [alpha, 1 - alpha])
+    return CriticalPoint(samples.mean(), samples.std(ddof=1), ci_low, ci_high,
+                         samples, sum(calls for _, calls in results))
+
+
+if __name__ == "__main__":
+    result = estimate_lambda_crit(seed=42)
+    print(f"λ_crit = {result.lambda_crit:.3f} ± {result.std:.3f} "
+          f"(95% CI [{result.ci_low:.3f}, {result.ci_high:.3f}], "
+          f"{result.solver_calls / len(result.samples):.1f} solver calls "
+          f"per trial)")
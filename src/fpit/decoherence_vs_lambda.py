@@ -0,0 +1,334 @@
+"""
+decoherence_simulation.py - Full Lindblad Dynamics Implementation
+"""
+
+from collections import namedtuple
+from importlib.util import find_spec
+
+import numpy as np
+
+from .instrumentation import phase, count
+from .plotting import pyplot
+from .result_cache import cached
+
+# QuTiP is only imported by the workers that use it
+QUTIP_INSTALLED = find_spec('qutip') is not None
+
+# ========== PLOT STYLING ==========
+STYLE = 'seaborn-v0_8-paper'
+RC_PARAMS = {
+    'font.family': 'serif',
+    'font.serif': ['Times New Roman'],
+    'axes.labelsize': 12,
+    'xtick.labelsize': 10,
+    'ytick.labelsize': 10,
+    'legend.fontsize': 10,
+    'grid.alpha': 0.3
+}
+
+# ========== THEORETICAL MODEL ==========
+
+
+def theoretical_decay(λ, λ0=1.0, P0=1.0):
+    """Analytical solution for decoherence suppression"""
+    return P0 * np.exp(-λ/λ0)
+
+# ========== QUANTUM SIMULATION ==========
+
+# Two-level model shared by both backends: H = 0, L = √λ σz, ρ0 = |0⟩⟨0|
+tlist = np.linspace(0, 10, 100)
+SIGMA_Z = np.diag([1.0, -1.0]).astype(complex)
+RHO0 = np.diag([1.0, 0.0]).astype(complex)
+
+
+def liouvillian(H, c_ops):
+    """Column-stacked Lindblad superoperator for H and collapse operators"""
+    eye = np.eye(H.shape[0])
+    L = -1j * (np.kron(eye, H) - np.kron(H.T, eye))
+    for C in c_ops:
+        CdC = C.conj().T @ C
+        L += (np.kron(C.conj(), C) - 0.5*np.kron(eye, CdC)
+              - 0.5*np.kron(CdC.T, eye))
+    return L
+
+
+def lindblad_batch(λ_values, times, H=None, c_op=SIGMA_Z, rho0=RHO0,
+                   e_op=RHO0):
+    """⟨e_op⟩(λ, t) for collapse operator √λ·c_op, all λ and t at once.
+
+    With H = 0 and a diagonal c_op (pure dephasing) the solution is closed
+    form: ρ_ij decays as exp(-λt|c_i - c_j|²/2). Otherwise the batched
+    superoperators exp(L(λ)Δt) are exponentiated once and applied per time
+    step, which requires uniformly spaced times starting at 0.
+    """
+    λ = np.asarray(λ_values, dtype=float)[:, None]
+    times = np.asarray(times, dtype=float)
+    n = rho0.shape[0]
+
+    if H is None and np.allclose(c_op, np.diag(np.diag(c_op))):
+        c = np.diag(c_op)
+        rate = 0.5 * np.abs(c[:, None] - c[None, :])**2
+        decay = np.exp(-np.multiply.outer(λ * times, rate))
+        rho_t = rho0 * decay
+        return np.einsum('ji,...ij->...', e_op, rho_t).real
+
+    if len(times) and times[0] != 0:
+        raise ValueError("times must start at 0 for the superoperator path")
+    step = times[1] - times[0] if len(times) > 1 else 0.0
+    if len(times) > 2 and not np.allclose(np.diff(times), step):
+        raise ValueError("times must be uniformly spaced for the "
+                         "superoperator path")
+
+    from scipy.linalg import expm
+    H = np.zeros((n, n), dtype=complex) if H is None else H
+    L0 = liouvillian(H, [])
+    L1 = liouvillian(np.zeros_like(H), [c_op])
+    P = expm((L0 + λ[:, :, None] * L1) * step)
+    rho = np.broadcast_to(rho0.reshape(-1, order='F'), (len(λ), n*n))
+    e_vec = e_op.T.reshape(-1, order='F')
+
+    expect = np.empty((len(λ), len(times)))
+    for k in range(len(times)):
+        if k:
+            rho = np.einsum('bij,bj->bi', P, rho)
+        expect[:, k] = (rho @ e_vec).real
+    return expect
+
+
+def _lindblad_qutip_point(λ):
+    """Final ⟨ρ0⟩ for one λ with QuTiP mesolve (used as a validator)"""
+    from qutip import qeye, mesolve, basis, Options
+    try:
+        H = 0 * qeye(2)
+        L = np.sqrt(λ) * (basis(2, 0).proj() - basis(2, 1).proj())
+        rho0 = basis(2, 0).proj()
+
+        with phase('qutip.mesolve', λ=λ):
+            result = mesolve(
+                H=H,
+                rho0=rho0,
+                tlist=tlist,
+                c_ops=[L],
+                e_ops=[rho0],
+                options=Options(store_states=False, nsteps=100000)
+            )
+
+        # Verify successful simulation
+        if len(result.expect[0]) == 0:
+            raise RuntimeError("Empty expectation values")
+
+        return result.expect[0][-1]
+
+    except Exception as e:
+        print(f"Simulation failed at λ={λ:.2f}: {str(e)}")
+        return np.nan
+
+
+@cached
+def lindblad_simulation(λ_values, backend='numpy', n_workers=None):
+    """Final branching probability ⟨ρ0⟩(t=10) for each λ.
+
+    backend='numpy' evaluates the whole scan in one array operation;
+    backend='sparse' uses the Krylov solver of lindblad_sparse (the path
+    for multi-qubit registers); backend='qutip' runs mesolve per λ across
+    a process pool.
+    """
+    count('lindblad.points', len(λ_values))
+    if backend == 'numpy':
+        with phase('lindblad_batch'):
+            return lindblad_batch(λ_values, tlist[-1:])[:, 0]
+    if backend == 'sparse':
+        from .lindblad_sparse import lindblad_sparse
+        times = np.array([0.0, tlist[-1]])
+        return lindblad_sparse(λ_values, times, np.zeros((2, 2)), [SIGMA_Z],
+                               RHO0, [RHO0])[0, :, -1]
+    if backend != 'qutip':
+        raise ValueError(f"Unknown backend {backend!r}")
+    if not QUTIP_INSTALLED:
+        raise ImportError("QuTiP required for Lindblad simulations")
+
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(n_workers) as pool:
+        return np.array(list(pool.map(_lindblad_qutip_point, λ_values)))
+
+
+def validate_lindblad(λ_values, n_workers=None):
+    """Maximum deviation between the NumPy and QuTiP backends"""
+    P_numpy = lindblad_simulation(λ_values)
+    P_qutip = lindblad_simulation(λ_values, backend='qutip',
+                                  n_workers=n_workers)
+    return np.nanmax(np.abs(P_numpy - P_qutip))
+
+# ========== DATA GENERATION ==========
+
+
+def generate_data(λ_range=(0, 3), n_points=100):
+    """Generate combined synthetic and Lindblad data"""
+    λ = np.linspace(*λ_range, n_points)
+
+    # Synthetic data with 5% noise
+    np.random.seed(42)
+    P_synth = theoretical_decay(λ) * (1 + 0.05*np.random.normal(size=n_points))
+
+    # Lindblad simulation (batched NumPy backend)
+    P_sim = lindblad_simulation(λ)
+
+    return λ, P_synth, P_sim
+
+# ========== FITTING ==========
+
+BootstrapFit = namedtuple(
+    'BootstrapFit', ['λ0', 'P0', 'λ0_ci', 'P0_ci', 'λ0_samples', 'P0_samples'])
+
+
+def fit_decay_batch(λ, P, weights=None, max_iter=20, tol=1.49e-8):
+    """Least-squares fits of P0·exp(-λ/λ0) for a batch of weightings.
+
+    weights is (B, n) (one row per fit, e.g. bootstrap counts) or None for
+    one unweighted fit. A log-linear weighted least-squares line (weights
+    w·P², the inverse variance of ln P) gives the start, then all B fits
+    are refined together by Gauss-Newton on (P0, k = 1/λ0), each solving
+    its 2×2 normal equations in closed form. Returns (λ0, P0), shape (B,).
+    """
+    λ = np.asarray(λ, dtype=float)
+    P = np.asarray(P, dtype=float)
+    w = np.ones((1, len(λ))) if weights is None else \
+        np.asarray(weights, dtype=float)
+
+    # Log-linear start: ln P = ln P0 - kλ, points with P ≤ 0 dropped
+    positive = P > 0
+    lnP = np.log(np.where(positive, P, 1.0))
+    wl = w * np.where(positive, P**2, 0.0)
+    S, Sx, Sxx, Sy, Sxy = (wl @ np.stack([np.ones_like(λ), λ, λ**2, lnP,
+                                          λ*lnP], axis=1)).T
+    k = -(S*Sxy - Sx*Sy) / (S*Sxx - Sx**2)
+    P0 = np.exp((Sy + k*Sx) / S)
+
+    # Normal equations and gradient from two matrix products per iteration:
+    # Σ wE²·[1, λ, λ²] and Σ wE·[P, λP]
+    powers = np.stack([np.ones_like(λ), λ, λ**2], axis=1)
+    data = np.stack([P, λ*P], axis=1)
+    active = slice(None)    # Converged fits are dropped from the batch
+    for _ in range(max_iter):
+        ka, P0a, wa = k[active], P0[active], w[active]
+        E = np.multiply.outer(ka, -λ)
+        np.exp(E, out=E)
+        wE = wa * E
+        E *= wE
+        s0, s1, s2 = (E @ powers).T
+        q0, q1 = (wE @ data).T
+        a11, a12, a22 = s0, -P0a*s1, P0a**2 * s2
+        g1, g2 = q0 - P0a*s0, -P0a*(q1 - P0a*s1)
+        det = a11*a22 - a12**2
+        dP0 = (a22*g1 - a12*g2) / det
+        dk = (a11*g2 - a12*g1) / det
+        P0[active] += dP0
+        k[active] += dk
+        count('fit_decay_batch.iterations', len(ka))
+        done = (np.abs(dk) <= tol*np.abs(ka + dk)) & \
+            (np.abs(dP0) <= tol*np.abs(P0a + dP0))
+        if done.all():
+            break
+        if done.any():
+            active = np.arange(len(k))[active][~done]
+    return 1/k, P0
+
+
+def bootstrap_decay_fit(λ, P, n_resamples=10**4, seed=None, confidence=0.95,
+                        chunk_size=2**10):
+    """Nonparametric bootstrap of the P0·exp(-λ/λ0) fit.
+
+    Each resample is drawn as multinomial counts over the data points and
+    used as fit weights, so resamples are fitted in batches of chunk_size
+    by fit_decay_batch. Returns a BootstrapFit with the full-data fit,
+    percentile confidence intervals and the resampled parameters.
+    """
+    λ = np.asarray(λ, dtype=float)
+    n = len(λ)
+    rng = np.random.default_rng(seed)
+    λ0_fit, P0_fit = (v[0] for v in fit_decay_batch(λ, P))
+    λ0_samples = np.empty(n_resamples)
+    P0_samples = np.empty(n_resamples)
+    with phase('bootstrap_decay_fit', n_resamples=n_resamples):
+        for start in range(0, n_resamples, chunk_size):
+            m = min(chunk_size, n_resamples - start)
+            draws = rng.integers(0, n, size=(m, n))
+            draws += (np.arange(m) * n)[:, None]
+            counts = np.bincount(draws.ravel(), minlength=m*n
+                                 ).reshape(m, n).astype(float)
+            λ0_samples[start:start+m], P0_samples[start:start+m] = \
+                fit_decay_batch(λ, P, counts)
+    alpha = (1 - confidence) / 2
+    return BootstrapFit(λ0_fit, P0_fit,
+                        tuple(np.quantile(λ0_samples, [alpha, 1 - alpha])),
+                        tuple(np.quantile(P0_samples, [alpha, 1 - alpha])),
+                        λ0_samples, P0_samples)
+
+# ========== PLOTTING ==========
+
+
+def create_figure(save_path='decoherence_vs_lambda.pdf'):
+    """Main figure generation routine"""
+    plt = pyplot(RC_PARAMS, style=STYLE)
+    λ, P_synth, P_sim = generate_data()
+
+    # Fit to theoretical model, with bootstrap confidence intervals
+    fit = bootstrap_decay_fit(λ, P_synth, seed=42)
+    λ0_fit, P0_fit = fit.λ0, fit.P0
+
+    # Create figure
+    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(8, 8),
+                                   gridspec_kw={'height_ratios': [3, 1]})
+
+    # Top panel: Probability plot
+    ax1.semilogy(λ, P_synth, 'ko', markersize=5, alpha=0.7,
+                 label='Synthetic Data')
+    if P_sim is not None:
+        ax1.semilogy(λ, P_sim, 'b^', markersize=6, alpha=0.7,
+                     label='Lindblad Simulation')
+
+    theory_line = ax1.plot(λ, theoretical_decay(λ, λ0_fit, P0_fit),
+                           'r-', lw=2,
+                           label=rf'Theory: $P = e^{{-\lambda/{λ0_fit:.2f}}}$ '
+                                 rf'($\lambda_0 \in [{fit.λ0_ci[0]:.2f}, '
+                                 rf'{fit.λ0_ci[1]:.2f}]$, 95% CI)')
+    band = np.quantile(theoretical_decay(λ, fit.λ0_samples[:, None],
+                                         fit.P0_samples[:, None]),
+                       [0.025, 0.975], axis=0)
+    ax1.fill_between(λ, *band, color='r', alpha=0.2)
+
+    ax1.axvline(1.0, color='gray', ls='--',
+                label=r'Critical $\lambda_{\mathrm{crit}}$')
+    ax1.set_ylabel(r'Branching Probability $P$')
+    ax1.legend()
+    ax1.grid(True, which='both', alpha=0.3)
+
+    # Bottom panel: Residuals
+    residuals = P_synth - theoretical_decay(λ, λ0_fit, P0_fit)
+    ax2.plot(λ, residuals, 'ko', markersize=4, alpha=0.7)
+    ax2.axhline(0, color='r', ls='-', lw=1)
+    ax2.fill_between(λ, -0.1, 0.1, color='gray', alpha=0.2,
+                     label=r'$\pm10\%$ Band')
+
+    if P_sim is not None:
+        res_sim = P_sim - theoretical_decay(λ, λ0_fit, P0_fit)
+        ax2.plot(λ, res_sim, 'b^', markersize=4, alpha=0.7,
+                 label='Lindblad Residuals')
+
+    ax2.set_xlabel(r'Constraint Strength $\lambda$')
+    ax2.set_ylabel('Residuals')
+    ax2.grid(True, alpha=0.3)
+    ax2.set_ylim(-0.15, 0.15)
+
+    plt.tight_layout()
+    plt.savefig(save_path, bbox_inches='tight')
+    print(f"Figure saved to {save_path}")
+
+
+if __name__ == "__main__":
+    if QUTIP_INSTALLED:
+        λ = np.linspace(0, 3, 100)
+        print(f"QuTiP validation: max |ΔP| = {validate_lindblad(λ):.2e}")
+    else:
+        print("Warning: QuTiP not installed - skipping Lindblad validation")
+    create_figure()
@@ -0,0 +1,112 @@
+import numpy as np
+
+from .plotting import pyplot
+from .result_cache import cached
+
+RC_PARAMS = {
+    "text.usetex": True,
+    "font.family": "serif",
+    "text.latex.preamble": r"\usepackage{amsmath}"
+}
+
+# Potential registry: name -> (V(ϕ, σ), dV/dϕ(ϕ, σ) or None)
+potentials = {}
+
+
+def register_potential(name, V, dV=None):
+    """Add a potential V(ϕ, σ) to the registry.
+
+    dV is its analytic ϕ-derivative; without one the derivative is taken
+    numerically with np.gradient on the ϕ grid.
+    """
+    potentials[name] = (V, dV)
+
+
+# Different potential functions
+register_potential(
+    'Gaussian',
+    lambda ϕ, σ: np.exp(-ϕ**2/(2*σ**2)),
+    lambda ϕ, σ: -ϕ/σ**2 * np.exp(-ϕ**2/(2*σ**2)))
+register_potential(
+    'Quartic',
+    lambda ϕ, σ: (ϕ**4)/(σ**4) - (ϕ**2)/(σ**2),
+    lambda ϕ, σ: 4*ϕ**3/σ**4 - 2*ϕ/σ**2)
+register_potential(
+    'Hyperbolic',
+    lambda ϕ, σ: np.cosh(ϕ/σ) - 1,
+    lambda ϕ, σ: np.sinh(ϕ/σ)/σ)
+
+# Stress-energy component calculation
+
+
+def T_exotic(ϕ, V, dV, λ):
+    return -λ * (0.5*(dV(ϕ))**2 - V(ϕ))
+
+
+@cached(bypass=('out',))
+def phase_diagram(names, σ_values, λ_values, ϕ, out=None, chunk_size=2**22):
+    """T_exotic over a (potential × σ × λ × ϕ) grid.
+
+    T = -λ·(½V'(ϕ)² - V(ϕ)) factorises into a λ part and a ϕ part, so V and
+    dV are evaluated once per (potential, σ) and broadcast over λ. Rows of λ
+    are written in chunks of about chunk_size elements into `out` (allocated
+    if not given; pass an np.memmap for grids larger than RAM).
+    """
+    λ_values = np.asarray(λ_values, dtype=float)
+    shape = (len(names), len(σ_values), len(λ_values), len(ϕ))
+    if out is None:
+        out = np.empty(shape)
+    rows = max(1, chunk_size // len(ϕ))
+
+    for p, name in enumerate(names):
+        V, dV = potentials[name]
+        for s, σ in enumerate(σ_values):
+            V_ϕ = V(ϕ, σ)
+            dV_ϕ = np.gradient(V_ϕ, ϕ) if dV is None else dV(ϕ, σ)
+            profile = 0.5*dV_ϕ**2 - V_ϕ
+            for start in range(0, len(λ_values), rows):
+                stop = min(start + rows, len(λ_values))
+                np.multiply.outer(-λ_values[start:stop], profile,
+                                  out=out[p, s, start:stop])
+    return out
+
+
+def create_figure(name, save_path, σ=1.0):
+    plt = pyplot(RC_PARAMS)
+    # Parameter space
+    ϕ = np.linspace(-3, 3, 500)
+    λ_range = np.logspace(-1, 2, 100)
+
+    # Phase diagram calculation
+    T = phase_diagram([name], [σ], λ_range, ϕ)
+
+    plt.figure(figsize=(14, 10))
+    plt.contourf(ϕ, λ_range, T[0, 0], levels=50, cmap='viridis')
+    plt.colorbar(label=r'$T_{\mu\nu}^{\text{(exotic)}}$')
+    plt.yscale('log')
+    plt.xlabel('Field Value (ϕ)', fontsize=14)
+    plt.ylabel('Constraint Strength (λ)', fontsize=14)
+    plt.title(f'Exotic Matter Phase Diagram: {name} Potential', fontsize=16)
+    plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    plt.close()
+
+
+def create_figure_gaussian(
+        save_path='exotic_matter_phase_diagram_gaussian.pdf'):
+    create_figure('Gaussian', save_path)
+
+
+def create_figure_quartic(
+        save_path='exotic_matter_phase_diagram_quartic.pdf'):
+    create_figure('Quartic', save_path)
+
+
+def create_figure_hyperbolic(
+        save_path='exotic_matter_phase_diagram_hyperbolic.pdf'):
+    create_figure('Hyperbolic', save_path)
+
+
+if __name__ == "__main__":
+    for name in potentials:
+        create_figure(name,
+                      f'exotic_matter_phase_diagram_{name.lower()}.pdf')
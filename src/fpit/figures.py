@@ -0,0 +1,195 @@
+"""
+figures.py - Parallel, incremental build of all paper figures
+
+Discovers every figure producer in the package (top-level `create_figure*`
+functions with a default `save_path`) by parsing the sources, so nothing is
+imported or computed during discovery. Producers are rendered in a process
+pool, one fresh process per figure so matplotlib state cannot leak between
+scripts. A figure is skipped when its output exists and the hash of its
+producer's source, the local modules it imports and its output name is
+unchanged since the last build. With --profile PREFIX every worker records
+instrumentation phases (import, figure, savefig, LaTeX runs and the solver
+phases) and the merged timeline is written to PREFIX.trace.json (Chrome
+trace) with a per-phase summary in PREFIX.json.
+
+Usage: python -m fpit.figures [--jobs N] [--output-dir DIR] [--force]
+                              [--list] [--profile PREFIX [--trace-memory]]
+                              [names ...]
+       fpit-figures ...   (when installed)
+"""
+
+import argparse
+import ast
+import fnmatch
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import get_context
+
+from . import instrumentation
+from ._deps import local_dependencies, module_path
+from . import MODULES
+from .instrumentation import phase
+
+MANIFEST = '.figures_manifest.json'
+
+
+def discover_figures():
+    """List (module, function, default save_path) for every producer"""
+    producers = []
+    for module in sorted(MODULES):
+        if module == 'figures':
+            continue
+        with open(module_path(module), encoding='utf-8') as f:
+            tree = ast.parse(f.read())
+        for node in tree.body:
+            if not (isinstance(node, ast.FunctionDef)
+                    and node.name.startswith('create_figure')):
+                continue
+            args = node.args.args + node.args.kwonlyargs
+            defaults = ([None] * (len(node.args.args)
+                                  - len(node.args.defaults))
+                        + node.args.defaults + node.args.kw_defaults)
+            for arg, default in zip(args, defaults):
+                if arg.arg == 'save_path' and \
+                        isinstance(default, ast.Constant) and \
+                        isinstance(default.value, str):
+                    producers.append((module, node.name, default.value))
+    return producers
+
+
+def figure_hash(module, function, save_path):
+    """Hash of the producer's code, its local dependencies and its output"""
+    digest = hashlib.sha256(f"{module}.{function}:{save_path}".encode())
+    for dep in local_dependencies(module):
+        with open(module_path(dep), 'rb') as f:
+            digest.update(dep.encode() + b'\0' + f.read())
+    return digest.hexdigest()
+
+
+def _instrument_matplotlib():
+    """Time figure saving and LaTeX runs, which dominate many producers"""
+    from matplotlib.figure import Figure
+    from matplotlib.texmanager import TexManager
+    instrumentation.wrap(Figure, 'savefig', 'savefig')
+    instrumentation.wrap(TexManager, 'make_dvi', 'latex')
+
+
+def _render(module, function, save_path, profile=False, trace_memory=False):
+    """Render one figure in a fresh worker process.
+
+    Returns (seconds, exported profile or None).
+    """
+    import importlib
+    os.environ.setdefault('MPLBACKEND', 'Agg')
+    if profile:
+        instrumentation.enable(trace_memory)
+        _instrument_matplotlib()
+    start = time.perf_counter()
+    with phase('import', module=module):
+        producer = getattr(importlib.import_module(f".{module}", __package__),
+                           function)
+    with phase('figure', name=f"{module}.{function}"):
+        producer(save_path=save_path)
+    elapsed = time.perf_counter() - start
+    profiler = instrumentation.disable()
+    return elapsed, profiler.export() if profiler else None
+
+
+def build_figures(output_dir='.', patterns=None, jobs=None, force=False,
+                  profile=None, trace_memory=False):
+    """Render out-of-date figures in parallel; returns {output: status}.
+
+    With profile set to a path prefix, the workers' instrumentation is
+    merged and written to <profile>.json and <profile>.trace.json.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    manifest_path = os.path.join(output_dir, MANIFEST)
+    manifest = {}
+    if os.path.exists(manifest_path):
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+
+    todo, status = [], {}
+    for module, function, save_path in discover_figures():
+        name = f"{module}.{function}"
+        if patterns and not any(fnmatch.fnmatch(name, p) or
+                                fnmatch.fnmatch(save_path, p)
+                                for p in patterns):
+            continue
+        key = figure_hash(module, function, save_path)
+        target = os.path.join(output_dir, save_path)
+        if not force and manifest.get(save_path) == key and \
+                os.path.exists(target):
+            status[save_path] = 'up to date'
+            print(f"{save_path}: up to date")
+            continue
+        todo.append((module, function, os.path.abspath(target), key))
+
+    profiler = instrumentation.enable(trace_memory) if profile else None
+    ctx = get_context('spawn')
+    with phase('build_figures', figures=len(todo)), \
+            ProcessPoolExecutor(jobs, mp_context=ctx,
+                                max_tasks_per_child=1) as pool:
+        futures = {pool.submit(_render, module, function, target,
+                               bool(profile), trace_memory):
+                   (target, key)
+                   for module, function, target, key in todo}
+        for future in as_completed(futures):
+            target, key = futures[future]
+            save_path = os.path.relpath(target, output_dir)
+            try:
+                elapsed, worker_profile = future.result()
+            except Exception as e:
+                status[save_path] = f'failed: {e!r}'
+                manifest.pop(save_path, None)
+            else:
+                status[save_path] = f'built in {elapsed:.1f}s'
+                manifest[save_path] = key
+                if worker_profile:
+                    profiler.merge(worker_profile)
+            print(f"{save_path}: {status[save_path]}")
+            # Record progress as we go so an interrupted build keeps it
+            with open(manifest_path, 'w') as f:
+                json.dump(manifest, f, indent=2, sort_keys=True)
+
+    if profiler is not None:
+        instrumentation.disable()
+        profiler.write_json(f"{profile}.json")
+        profiler.write_chrome_trace(f"{profile}.trace.json")
+    return status
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Build the paper figures in parallel, skipping "
+                    "unchanged ones")
+    parser.add_argument('names', nargs='*',
+                        help="glob patterns on module.function or output "
+                             "file name")
+    parser.add_argument('--jobs', '-j', type=int, default=None)
+    parser.add_argument('--output-dir', '-o', default='.')
+    parser.add_argument('--force', action='store_true')
+    parser.add_argument('--list', action='store_true')
+    parser.add_argument('--profile', metavar='PREFIX',
+                        help="write PREFIX.json and PREFIX.trace.json")
+    parser.add_argument('--trace-memory', action='store_true',
+                        help="record net and peak traced bytes per phase "
+                             "(tracemalloc; slower)")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for module, function, save_path in discover_figures():
+            print(f"{module}.{function} -> {save_path}")
+    else:
+        status = build_figures(args.output_dir, args.names, args.jobs,
+                               args.force, args.profile, args.trace_memory)
+        failed = [k for k, v in status.items() if v.startswith('failed')]
+        print(f"{len(status) - len(failed)} figures ok, {len(failed)} failed")
+        raise SystemExit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
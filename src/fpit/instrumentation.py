@@ -0,0 +1,197 @@
+"""
+instrumentation.py - Opt-in phase timers, counters and memory stats for the solvers
+
+Code marks its hot paths with `with phase('name'):` and `count('name', n)`.
+Until enable() is called these are no-ops: phase() hands back one shared
+null context and count() returns immediately, so instrumented code runs at
+full speed. When enabled, each phase records its wall time and a net memory
+change. With trace_memory=True (via tracemalloc) that is the change in
+traced bytes, NumPy buffers included, along with the phase's peak traced
+memory. Otherwise only the net change in live Python object blocks
+(sys.getallocatedblocks) is cheap to take; it misses NumPy data buffers
+and other raw allocations. Results export as a JSON summary or as a Chrome trace
+(chrome://tracing, Perfetto); events from worker processes can be merged so
+a whole figure build or sweep shows up on one timeline.
+"""
+
+import contextlib
+import functools
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+
+_NULL = contextlib.nullcontext()
+_profiler = None
+
+
+class _Phase:
+    __slots__ = ('profiler', 'name', 'args', 'start', 'mem', 'peak')
+
+    def __init__(self, profiler, name, args):
+        self.profiler, self.name, self.args = profiler, name, args
+
+    def __enter__(self):
+        p = self.profiler
+        if p.trace_memory:
+            # Hand the peak so far to the enclosing phase, then start afresh
+            if p._stack:
+                p._stack[-1].peak = max(p._stack[-1].peak,
+                                        tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+        self.peak = 0
+        p._stack.append(self)
+        self.mem = p._memory()
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        end = time.perf_counter_ns()
+        p = self.profiler
+        mem = p._memory() - self.mem
+        p._stack.pop()
+        if p.trace_memory:
+            self.peak = max(self.peak, tracemalloc.get_traced_memory()[1])
+            if p._stack:
+                p._stack[-1].peak = max(p._stack[-1].peak, self.peak)
+        p.events.append((self.name, self.start, end - self.start,
+                         os.getpid(), threading.get_ident(), mem,
+                         self.peak, self.args))
+
+
+class Profiler:
+    """Collected phase events and counters of one process (or merged)"""
+
+    def __init__(self, trace_memory=False):
+        self.trace_memory = trace_memory
+        self.events = []      # (name, start_ns, dur_ns, pid, tid, net_mem,
+        self.counters = {}    #  peak_bytes, args)
+        self._stack = []
+        # net_mem is in traced bytes or in Python object blocks
+        self.memory_key = 'net_bytes' if trace_memory else 'net_pyobj_blocks'
+
+    def _memory(self):
+        if self.trace_memory:
+            return tracemalloc.get_traced_memory()[0]
+        return sys.getallocatedblocks()
+
+    def phase(self, name, /, **args):
+        return _Phase(self, name, args)
+
+    def count(self, name, n=1):
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def export(self):
+        """Picklable state, for sending from a worker to the parent"""
+        return {'events': list(self.events), 'counters': dict(self.counters),
+                'memory_key': self.memory_key}
+
+    def merge(self, exported):
+        """Add the events and counters of another Profiler.export()"""
+        if exported.get('memory_key', self.memory_key) != self.memory_key:
+            raise ValueError("cannot merge profiles with different "
+                             "trace_memory settings")
+        self.events.extend(tuple(e) for e in exported['events'])
+        for name, n in exported['counters'].items():
+            self.count(name, n)
+
+    def summary(self):
+        """Per-phase calls, total/mean/max seconds, net memory and peak bytes
+
+        The net memory key is memory_key: net_bytes under trace_memory,
+        else net_pyobj_blocks.
+        """
+        key = self.memory_key
+        phases = {}
+        for name, _, dur, _, _, mem, peak, _ in self.events:
+            s = phases.setdefault(name, {'calls': 0, 'total_s': 0.0,
+                                         'max_s': 0.0, key: 0,
+                                         'peak_bytes': 0})
+            s['calls'] += 1
+            s['total_s'] += dur / 1e9
+            s['max_s'] = max(s['max_s'], dur / 1e9)
+            s[key] += mem
+            s['peak_bytes'] = max(s['peak_bytes'], peak)
+        for s in phases.values():
+            s['mean_s'] = s['total_s'] / s['calls']
+        return {'phases': phases, 'counters': dict(self.counters)}
+
+    def write_json(self, path):
+        with open(path, 'w') as f:
+            json.dump(self.summary(), f, indent=2, sort_keys=True)
+
+    def write_chrome_trace(self, path):
+        """Chrome trace-event JSON: one complete event per phase"""
+        trace = []
+        t0 = min((e[1] for e in self.events), default=0)
+        for name, start, dur, pid, tid, mem, peak, args in self.events:
+            trace.append({'name': name, 'ph': 'X', 'pid': pid, 'tid': tid,
+                          'ts': (start - t0) / 1e3, 'dur': dur / 1e3,
+                          'args': {**{k: repr(v) for k, v in args.items()},
+                                   self.memory_key: mem,
+                                   'peak_bytes': peak}})
+        trace.append({'name': 'counters', 'ph': 'C', 'pid': os.getpid(),
+                      'ts': 0, 'args': self.counters})
+        with open(path, 'w') as f:
+            json.dump({'traceEvents': trace, 'displayTimeUnit': 'ms'}, f)
+
+
+def enable(trace_memory=False):
+    """Start collecting in this process; returns the active Profiler"""
+    global _profiler
+    if trace_memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    _profiler = Profiler(trace_memory)
+    return _profiler
+
+
+def disable():
+    """Stop collecting; returns the Profiler that was active (or None)"""
+    global _profiler
+    profiler, _profiler = _profiler, None
+    if profiler is not None and profiler.trace_memory:
+        tracemalloc.stop()
+    return profiler
+
+
+def active():
+    return _profiler
+
+
+def phase(name, /, **args):
+    """Context manager timing a phase (a shared no-op when disabled)"""
+    if _profiler is None:
+        return _NULL
+    return _profiler.phase(name, **args)
+
+
+def count(name, n=1):
+    """Add n to a counter (no-op when disabled)"""
+    if _profiler is not None:
+        _profiler.count(name, n)
+
+
+def instrumented(name=None):
+    """Decorator running the function inside phase(name or qualname)"""
+    def decorate(func):
+        label = name or f"{func.__module__}.{func.__qualname__}"
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _profiler is None:
+                return func(*args, **kwargs)
+            with _profiler.phase(label):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def wrap(owner, attr, name):
+    """Instrument a third-party callable in place, e.g. Figure.savefig"""
+    func = getattr(owner, attr)
+    if not getattr(func, '_instrumented', False):
+        wrapper = instrumented(name)(func)
+        wrapper._instrumented = True
+        setattr(owner, attr, wrapper)
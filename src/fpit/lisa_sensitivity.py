@@ -0,0 +1,165 @@
+from functools import lru_cache
+
+import numpy as np
+
+from .plotting import pyplot
+
+# Configure LaTeX styling
+RC_PARAMS = {
+    "text.usetex": True,
+    "font.family": "serif",
+    "font.size": 12,
+    "axes.labelsize": 14,
+    "axes.titlesize": 16,
+    "legend.fontsize": 12
+}
+
+# SNR grid defaults
+f_ref = 1e-3            # Reference frequency of the FPIT power law (Hz)
+snr_threshold = 8.0     # Detection threshold on the optimal SNR
+T_obs = 4 * 365.25 * 86400  # Nominal LISA mission duration (s)
+
+# Robson, Cornish & Liu (2019) instrument parameters
+L_arm = 2.5e9           # Arm length (m)
+f_star = 19.09e-3       # Transfer frequency c/(2πL) (Hz)
+
+
+def noise_psd(f):
+    """Sky-averaged LISA strain noise PSD S_n(f) in 1/Hz (Robson+2019 eq. 1)
+
+    Instrument noise only; the galactic confusion foreground is not included.
+    """
+    x = f / f_star
+    return (10 / (3 * L_arm**2)
+            * (S_oms(f) + 2 * (1 + np.cos(x)**2) * S_acc(f) / (2*np.pi*f)**4)
+            * (1 + 0.6 * x**2))
+
+
+def lisa_sensitivity(f):
+    """LISA strain amplitude spectral density √S_n(f) in 1/√Hz"""
+    return np.sqrt(noise_psd(f))
+
+def S_acc(f):
+    """Single-link acceleration noise P_acc in m²/s⁴/Hz"""
+    return 9e-30 * (1 + (0.4e-3/f)**2) * (1 + (f/8e-3)**4)
+
+def S_oms(f):
+    """Single-link optical metrology noise P_OMS in m²/Hz"""
+    return 2.25e-22 * (1 + (2e-3/f)**4)
+
+
+@lru_cache(maxsize=8)
+def frequency_table(f_min=1e-5, f_max=1.0, n=8192):
+    """Log-spaced frequencies and 1/S_n on them, computed once per range"""
+    f = np.logspace(np.log10(f_min), np.log10(f_max), n)
+    inv_psd = 1 / noise_psd(f)
+    f.flags.writeable = False
+    inv_psd.flags.writeable = False
+    return f, inv_psd
+
+
+def _cumulative_overlap(alphas, f, inv_psd):
+    """∫_{f_0}^{f} (f'/f_ref)^(-2α) / S_n df' on the table, per α (n_α, n_f)
+
+    Integrated with the trapezoid rule in ln f, where the integrand
+    f·(f/f_ref)^(-2α)/S_n is smooth.
+    """
+    log_f = np.log(f)
+    integrand = np.exp((1 - 2*alphas[:, None]) * log_f
+                       + 2*alphas[:, None] * np.log(f_ref)) * inv_psd
+    cum = np.zeros_like(integrand)
+    np.cumsum(0.5 * (integrand[:, 1:] + integrand[:, :-1]) * np.diff(log_f),
+              axis=1, out=cum[:, 1:])
+    return cum
+
+
+def band_overlap(alphas, bands, table=None):
+    """Band integrals I[α, band] = ∫_band (f/f_ref)^(-2α) / S_n df
+
+    bands is (n_band, 2) of (f_lo, f_hi); edges are clipped to the table and
+    the cumulative integral is interpolated linearly in ln f.
+    """
+    f, inv_psd = frequency_table() if table is None else table
+    alphas = np.atleast_1d(np.asarray(alphas, dtype=float))
+    bands = np.clip(np.atleast_2d(np.asarray(bands, dtype=float)),
+                    f[0], f[-1])
+    cum = _cumulative_overlap(alphas, f, inv_psd)
+
+    log_f = np.log(f)
+    log_edges = np.log(bands)
+    i = np.clip(np.searchsorted(log_f, log_edges) - 1, 0, len(f) - 2)
+    w = (log_edges - log_f[i]) / (log_f[i + 1] - log_f[i])
+    at_edges = cum[:, i] * (1 - w) + cum[:, i + 1] * w   # (α, band, 2)
+    return at_edges[..., 1] - at_edges[..., 0]
+
+
+def snr_map(amplitudes, alphas, bands, distances, d_ref=1.0, table=None,
+            duration=T_obs):
+    """Optimal SNR of a signal with strain ASD A·(f/f_ref)^(-α)·(d_ref/d).
+
+    A is in 1/√Hz, the same units as lisa_sensitivity. Observed for duration
+    seconds the signal has |h̃(f)|² = S_h(f)·duration/2, so
+    SNR² = 4∫_band |h̃|²/S_n df = 2·duration·A²(d_ref/d)² times the band
+    integral. The noise is integrated once per (α, band) and the result
+    broadcast to shape (n_amplitude, n_alpha, n_band, n_distance).
+    """
+    amplitudes = np.atleast_1d(np.asarray(amplitudes, dtype=float))
+    distances = np.atleast_1d(np.asarray(distances, dtype=float))
+    root_I = np.sqrt(2 * duration * band_overlap(alphas, bands, table))
+    return (amplitudes[:, None, None, None] * root_I[None, :, :, None]
+            * (d_ref / distances)[None, None, None, :])
+
+
+def detectability(snr, threshold=snr_threshold):
+    """Boolean detectability map (SNR above threshold)"""
+    return snr >= threshold
+
+
+def create_figure(save_path='lisa_curve.pdf'):
+    plt = pyplot(RC_PARAMS)
+    # Generate data
+    f = np.logspace(-4, -1, 300)  # 0.1 mHz to 100 mHz
+    lisa_curve = lisa_sensitivity(f)
+    fpit_strain = 1e-23 * (f/f_ref)**(-2.5)  # FPIT scaling law (1/√Hz)
+
+    # Plot
+    plt.figure(figsize=(10,6))
+    plt.loglog(f, lisa_curve, 'k-', lw=2, label='LISA Sensitivity (Robson+2019)')
+    plt.loglog(f, fpit_strain, 'r--', lw=2, label='FPIT Predicted Signal')
+    plt.xlabel('Frequency [Hz]', fontsize=14)
+    plt.ylabel(r'Strain ASD $[1/\sqrt{\rm Hz}]$', fontsize=14)
+    plt.title('LISA Sensitivity vs FPIT Gravitational Wave Signals', fontsize=16)
+    plt.grid(True, which='both', alpha=0.4)
+    plt.legend()
+    plt.xlim(1e-4, 1e-1)
+    plt.ylim(1e-24, 1e-15)
+    plt.tight_layout()
+    plt.savefig(save_path, bbox_inches='tight')
+
+
+def create_figure_snr(save_path='lisa_detectability.pdf'):
+    plt = pyplot(RC_PARAMS)
+    amplitudes = np.logspace(-26, -20, 400)
+    alphas = np.linspace(0, 4, 400)
+    snr = snr_map(amplitudes, alphas, [(1e-4, 1e-1)], [1.0])[:, :, 0, 0]
+
+    plt.figure(figsize=(10,6))
+    plt.pcolormesh(alphas, amplitudes, np.log10(snr), shading='auto',
+                   cmap='viridis')
+    plt.colorbar(label=r'$\log_{10}\,\mathrm{SNR}$')
+    plt.contour(alphas, amplitudes, snr, levels=[snr_threshold],
+                colors='r', linewidths=2)
+    plt.plot(2.5, 1e-23, 'r*', ms=14, label='FPIT Predicted Signal')
+    plt.yscale('log')
+    plt.xlabel(r'Spectral Index $\alpha$', fontsize=14)
+    plt.ylabel(r'Strain ASD at 1 mHz $[1/\sqrt{\rm Hz}]$', fontsize=14)
+    plt.title(f'LISA Detectability (SNR $\\geq$ {snr_threshold:g})',
+              fontsize=16)
+    plt.legend(loc='upper right')
+    plt.tight_layout()
+    plt.savefig(save_path, bbox_inches='tight')
+
+
+if __name__ == "__main__":
+    create_figure()
+    create_figure_snr()
@@ -0,0 +1,122 @@
+from functools import partial
+
+import numpy as np
+
+from .monte_carlo import monte_carlo
+from .plotting import pyplot
+from .result_cache import cached
+
+# Configure style
+RC_PARAMS = {"font.size": 12, "font.family": "serif"}
+
+seed = 42         # Base seed for the synthetic curve and the trials
+n_trials = 1000   # Monte Carlo trials (matches paper's Monte Carlo)
+
+# Paper's described regimes:
+# 1. Weak coupling (λ < 1): High perturbations ~0.1
+# 2. Critical phase (1 ≤ λ ≤ 1.5): Stabilization to <1e-3
+# 3. Strong constraints (λ > 1.5): Topological locking ~1e-4
+
+
+def regime_noise_levels(lambda_vals):
+    """Measurement noise per regime (matches paper's numerical error
+    estimates)"""
+    return np.where(
+        lambda_vals < 1,
+        0.02,
+        np.where(
+            lambda_vals <= 1.5,
+            0.001,
+            0.0001
+        )
+    )
+
+
+def synthetic_delta_h(lambda_vals, rng):
+    """Synthetic Δh_tt matching the paper's regimes, with measurement noise"""
+    delta_h = np.zeros_like(lambda_vals)
+
+    # Theoretical model
+    weak_mask = lambda_vals < 1
+    critical_mask = (lambda_vals >= 1) & (lambda_vals <= 1.5)
+    strong_mask = lambda_vals > 1.5
+
+    # Base metric perturbations
+    delta_h[weak_mask] = 0.1 * (1 + 0.2*rng.standard_normal(sum(weak_mask)))
+    delta_h[critical_mask] = 1e-3 * \
+        np.exp(-8*(lambda_vals[critical_mask] - 1))
+    delta_h[strong_mask] = 1e-4 * \
+        (1 + 0.1*rng.standard_normal(sum(strong_mask)))
+
+    return delta_h + regime_noise_levels(lambda_vals) * \
+        rng.standard_normal(len(lambda_vals))
+
+
+def _trial_chunk(delta_h, noise_levels, rng, size):
+    """One chunk of Monte Carlo trials: delta_h plus fresh noise"""
+    return delta_h + noise_levels * rng.standard_normal((size, len(delta_h)))
+
+
+@cached
+def trial_statistics(delta_h, noise_levels, n_trials=n_trials, seed=seed,
+                     n_workers=1, chunk_size=1000):
+    """Streaming Monte Carlo statistics of the trial Δh_tt per λ.
+
+    Memory is O(len(λ)) regardless of n_trials; results are reproducible for
+    a given (seed, n_workers). Returns a monte_carlo.RunningStats.
+    """
+    return monte_carlo(partial(_trial_chunk, delta_h, noise_levels),
+                       n_trials,
+                       lo=delta_h - 6*noise_levels,
+                       hi=delta_h + 6*noise_levels,
+                       seed=seed, n_workers=n_workers, chunk_size=chunk_size)
+
+
+def create_figure(save_path='metric_rigidity.pdf'):
+    plt = pyplot(RC_PARAMS, seaborn_style="whitegrid")
+    # Generate synthetic data matching paper's regimes
+    lambda_vals = np.linspace(0.5, 2.5, 500)
+    noise_levels = regime_noise_levels(lambda_vals)
+    delta_h = synthetic_delta_h(lambda_vals, np.random.default_rng(seed))
+
+    # Compute confidence intervals from the Monte Carlo trials
+    stats = trial_statistics(delta_h, noise_levels)
+    mean_dh = stats.mean
+    std_dh = stats.std
+
+    # Create figure
+    fig, ax = plt.subplots(figsize=(10, 6))
+
+    # Plot mean and confidence intervals
+    ax.plot(lambda_vals, mean_dh, color='#2c7bb6', lw=2,
+            label=r"Mean $\Delta h_{tt}$")
+    ax.fill_between(lambda_vals,
+                    mean_dh - 2*std_dh,
+                    mean_dh + 2*std_dh,
+                    color='#abd9e9', alpha=0.3,
+                    label="95% CI")
+
+    # Critical thresholds
+    ax.axvline(1, color='#d7191c', ls='--', lw=1.5,
+               label=r"Critical Phase ($\lambda=1$)")
+    ax.axvline(1.5, color='#fdae61', ls='--', lw=1.5,
+               label=r"Topological Locking ($\lambda=1.5$)")
+
+    # Formatting
+    ax.set(
+        xlabel=r"Coupling Strength $\lambda$",
+        ylabel=r"Metric Perturbation $\Delta h_{tt}$",
+        yscale="log",
+        ylim=(1e-5, 0.2),
+        xlim=(0.5, 2.5),
+        title="Metric Rigidity Phase Diagram"
+    )
+    ax.legend(loc="upper right", frameon=True)
+    ax.grid(True, which="both", ls="--")
+
+    plt.tight_layout()
+    plt.savefig(save_path, bbox_inches="tight")
+
+
+if __name__ == "__main__":
+    create_figure()
@@ -0,0 +1,133 @@
+"""
+monte_carlo.py - Chunked, seeded Monte Carlo engine with streaming statistics
+
+Trials are drawn in fixed-size chunks and folded into running accumulators
+(mean/variance via Chan's parallel update, quantiles via fixed-range
+histograms), so memory stays O(n_outputs) however many trials are run.
+Each worker owns an independent np.random.Generator spawned from one
+SeedSequence and results are merged in worker order, which makes the output
+bit-reproducible for a given seed, worker count and chunk size.
+"""
+
+import numpy as np
+
+from .instrumentation import phase, count
+
+
+class RunningStats:
+    """Streaming per-output count, mean, variance and histogram quantiles.
+
+    Quantiles are resolved to one histogram bin on [lo, hi]; samples outside
+    the range are counted in under/overflow bins.
+    """
+
+    def __init__(self, lo, hi, bins=512):
+        self.lo = np.asarray(lo, dtype=float)
+        self.hi = np.asarray(hi, dtype=float)
+        self.bins = bins
+        self.count = 0
+        self.mean = np.zeros(self.lo.shape)
+        self.m2 = np.zeros(self.lo.shape)
+        self.hist = np.zeros(self.lo.shape + (bins + 2,), dtype=np.int64)
+
+    def update(self, samples):
+        """Fold a (n_samples, n_outputs) chunk into the accumulators"""
+        samples = np.asarray(samples, dtype=float)
+        n = len(samples)
+        if n == 0:
+            return
+        chunk_mean = samples.mean(axis=0)
+        chunk_m2 = ((samples - chunk_mean)**2).sum(axis=0)
+        self._combine(n, chunk_mean, chunk_m2)
+
+        width = (self.hi - self.lo) / self.bins
+        idx = np.floor((samples - self.lo) / width).astype(np.int64) + 1
+        np.clip(idx, 0, self.bins + 1, out=idx)
+        flat = idx + np.arange(self.lo.size) * (self.bins + 2)
+        self.hist += np.bincount(flat.ravel(),
+                                 minlength=self.hist.size
+                                 ).reshape(self.hist.shape)
+
+    def _combine(self, n, mean, m2):
+        total = self.count + n
+        delta = mean - self.mean
+        self.mean = self.mean + delta * (n / total)
+        self.m2 = self.m2 + m2 + delta**2 * (self.count * n / total)
+        self.count = total
+
+    def merge(self, other):
+        """Fold another accumulator with the same range into this one"""
+        if other.count:
+            self._combine(other.count, other.mean, other.m2)
+            self.hist += other.hist
+        return self
+
+    @property
+    def var(self):
+        return self.m2 / self.count
+
+    @property
+    def std(self):
+        return np.sqrt(self.var)
+
+    def quantile(self, q):
+        """Approximate quantile(s) q in [0, 1], interpolated within a bin"""
+        q = np.atleast_1d(q)
+        width = (self.hi - self.lo) / self.bins
+        cum = np.cumsum(self.hist, axis=-1)
+        out = np.empty(q.shape + self.lo.shape)
+        for k, qk in enumerate(q):
+            target = qk * self.count
+            # Index of the first bin whose cumulative count reaches target
+            b = np.minimum((cum < target).sum(axis=-1), self.bins + 1)
+            below = np.take_along_axis(cum, b[..., None] - 1, -1)[..., 0]
+            below = np.where(b > 0, below, 0)
+            inside = np.take_along_axis(self.hist, b[..., None], -1)[..., 0]
+            frac = np.where(inside > 0, (target - below) / np.maximum(inside, 1),
+                            0.5)
+            out[k] = self.lo + (np.clip(b - 1, 0, self.bins - 1) + frac) * width
+        return out if len(q) > 1 else out[0]
+
+
+def _run_worker(sample_chunk, n_trials, seed_seq, chunk_size, lo, hi, bins):
+    """Draw n_trials in chunks from one RNG stream into a RunningStats"""
+    rng = np.random.default_rng(seed_seq)
+    stats = RunningStats(lo, hi, bins)
+    for start in range(0, n_trials, chunk_size):
+        stats.update(sample_chunk(rng, min(chunk_size, n_trials - start)))
+    return stats
+
+
+def monte_carlo(sample_chunk, n_trials, lo, hi, seed=None, n_workers=1,
+                chunk_size=1000, bins=512):
+    """Run n_trials of `sample_chunk(rng, size) -> (size, n_outputs)`.
+
+    Trials are split into contiguous shares, one per worker, each with its
+    own child SeedSequence. With n_workers > 1 the shares run in a process
+    pool, so sample_chunk must be picklable. Returns the merged RunningStats.
+
+    Results are bit-reproducible for a fixed seed, n_workers and chunk_size.
+    Changing chunk_size changes how a worker's stream is split between
+    sample_chunk calls, and with it the draws of any sample_chunk making
+    more than one draw per call, as well as the order in which chunk
+    statistics are combined.
+    """
+    children = np.random.SeedSequence(seed).spawn(n_workers)
+    shares = [n_trials // n_workers + (w < n_trials % n_workers)
+              for w in range(n_workers)]
+    args = [(sample_chunk, share, child, chunk_size, lo, hi, bins)
+            for share, child in zip(shares, children)]
+
+    with phase('monte_carlo', n_trials=n_trials, n_workers=n_workers):
+        if n_workers == 1:
+            parts = [_run_worker(*args[0])]
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(n_workers) as pool:
+                parts = list(pool.map(_run_worker, *zip(*args)))
+    count('monte_carlo.trials', n_trials)
+
+    stats = RunningStats(lo, hi, bins)
+    for part in parts:
+        stats.merge(part)
+    return stats
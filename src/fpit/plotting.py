@@ -0,0 +1,21 @@
+"""
+plotting.py - Lazy matplotlib access for the figure producers
+
+The compute modules never import matplotlib (or seaborn) at import time;
+each figure producer calls pyplot() with its module's style instead, so the
+solvers can be imported cheaply and without side effects, e.g. in worker
+processes.
+"""
+
+
+def pyplot(rc_params=None, style=None, seaborn_style=None):
+    """matplotlib.pyplot, imported on first use, with the given style applied"""
+    import matplotlib.pyplot as plt
+    if style is not None:
+        plt.style.use(style)
+    if seaborn_style is not None:
+        import seaborn as sns
+        sns.set_style(seaborn_style)
+    if rc_params is not None:
+        plt.rcParams.update(rc_params)
+    return plt
@@ -0,0 +1,333 @@
+"""
+result_cache.py - Content-addressed on-disk cache for simulation outputs
+
+Results are keyed on a SHA-256 of the function, its arguments, the module
+constants and registries it reads and the source of its module (and the
+package modules that module imports), so any code change invalidates the
+affected entries. Plain functions, among the arguments or in a registry,
+are keyed on their bytecode, constants and closure values, not just their
+name.
+Arrays are stored one `.npy` file each and loaded back memory-mapped
+read-only, so large grids are not copied into RAM. The cache is size
+bounded with least-recently-used eviction.
+
+Caching is opt-in: decorated functions run uncached unless a cache is
+configured, either with configure_cache() or the FPIT_CACHE_DIR environment
+variable (FPIT_CACHE_MAX_BYTES sets the size bound). Hashing and file
+handling modules are imported on first use, so decorating a function
+costs next to nothing at import time.
+"""
+
+import functools
+import importlib
+import inspect
+import json
+import os
+import time
+
+import numpy as np
+
+from ._deps import PACKAGE_DIR, local_dependencies, module_path
+
+DEFAULT_MAX_BYTES = 4 * 2**30
+
+_default_cache = None
+_MISSING = object()
+
+
+def _fingerprint(obj, digest):
+    """Feed a canonical encoding of obj into digest"""
+    if isinstance(obj, np.ndarray):
+        arr = np.ascontiguousarray(obj)
+        digest.update(f"ndarray:{arr.dtype.str}:{arr.shape}:".encode())
+        digest.update(arr.tobytes())
+    elif isinstance(obj, (list, tuple)):
+        digest.update(f"{type(obj).__name__}:{len(obj)}:".encode())
+        for item in obj:
+            _fingerprint(item, digest)
+    elif isinstance(obj, dict):
+        digest.update(f"dict:{len(obj)}:".encode())
+        for key in sorted(obj, key=repr):
+            _fingerprint(key, digest)
+            _fingerprint(obj[key], digest)
+    elif isinstance(obj, functools.partial):
+        digest.update(b"partial:")
+        _fingerprint((obj.func, obj.args, obj.keywords), digest)
+    elif callable(obj) and hasattr(obj, '__qualname__'):
+        digest.update(f"callable:{obj.__module__}.{obj.__qualname__}:"
+                      .encode())
+        if inspect.isfunction(obj):
+            # Lambdas all share the qualname <lambda>: hash what they do
+            _code_fingerprint(obj.__code__, digest)
+            _fingerprint((obj.__defaults__, obj.__kwdefaults__), digest)
+            for cell in obj.__closure__ or ():
+                try:
+                    value = cell.cell_contents
+                except ValueError:
+                    value = None
+                # A recursive inner function holds itself in its closure
+                _fingerprint(None if value is obj else value, digest)
+    elif inspect.iscode(obj):
+        _code_fingerprint(obj, digest)
+    elif isinstance(obj, np.generic):
+        digest.update(f"{obj.dtype.str}:{obj!r}:".encode())
+    else:
+        digest.update(f"{type(obj).__name__}:{obj!r}:".encode())
+
+
+def _code_fingerprint(code, digest):
+    """Bytecode, constants and referenced names of a code object"""
+    digest.update(b"code:")
+    digest.update(code.co_code)
+    _fingerprint((code.co_names, code.co_consts), digest)
+
+
+def _code_names(code):
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if inspect.iscode(const):
+            names |= _code_names(const)
+    return names
+
+
+@functools.lru_cache(maxsize=None)
+def _source_digest(source_file):
+    """Hash of a module's source and of the package modules it imports"""
+    import hashlib
+    digest = hashlib.sha256()
+    files = [source_file]
+    if os.path.dirname(os.path.abspath(source_file)) == PACKAGE_DIR:
+        module = os.path.splitext(os.path.basename(source_file))[0]
+        files += [module_path(dep) for dep in local_dependencies(module)]
+    for path in sorted(set(os.path.abspath(f) for f in files)):
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def function_key(func, args, kwargs):
+    """Cache key for calling func(*args, **kwargs)"""
+    import hashlib
+    digest = hashlib.sha256(
+        f"{func.__module__}.{func.__qualname__}:".encode())
+    digest.update(_source_digest(inspect.getsourcefile(func)).encode())
+
+    # Module-level constants and registries the function reads (grid
+    # sizes, steps, the functions registered in a dict, ...)
+    for name in sorted(_code_names(func.__code__)):
+        value = func.__globals__.get(name)
+        if isinstance(value, (bool, int, float, complex, str, tuple, dict,
+                              np.ndarray, np.generic)):
+            _fingerprint((name, value), digest)
+
+    bound = inspect.signature(func).bind(*args, **kwargs)
+    bound.apply_defaults()
+    _fingerprint(dict(bound.arguments), digest)
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """Size-bounded LRU store of function results under `root`"""
+
+    def __init__(self, root, max_bytes=DEFAULT_MAX_BYTES):
+        self.root = os.path.abspath(root)
+        self.max_bytes = max_bytes
+        os.makedirs(self.root, exist_ok=True)
+
+    def _entry(self, key):
+        return os.path.join(self.root, key[:2], key)
+
+    def _entries(self):
+        """Yield (path, meta, mtime) for every stored entry"""
+        for prefix in os.listdir(self.root):
+            sub = os.path.join(self.root, prefix)
+            if not os.path.isdir(sub):
+                continue
+            for key in os.listdir(sub):
+                if key.startswith('.tmp-'):
+                    continue    # Another writer's entry under construction
+                meta_path = os.path.join(sub, key, 'meta.json')
+                try:
+                    with open(meta_path) as f:
+                        meta = json.load(f)
+                    mtime = os.path.getmtime(meta_path)
+                except (OSError, ValueError):
+                    continue    # Removed or replaced concurrently
+                yield os.path.join(sub, key), meta, mtime
+
+    def get(self, key, default=None):
+        """Stored result for key, or default; marks the entry as recently
+        used"""
+        path = self._entry(key)
+        meta_path = os.path.join(path, 'meta.json')
+        try:
+            with open(meta_path) as f:
+                meta = json.load(f)
+            result = _load(path, meta['layout'])
+        except (OSError, ValueError, KeyError):
+            return default
+        os.utime(meta_path)
+        return result
+
+    def put(self, key, result, func_name=''):
+        """Store a result and evict old entries beyond max_bytes.
+
+        Safe against concurrent writers of the same key: the entry is
+        built in a temporary directory and renamed into place, and if
+        another writer got there first its (identical) entry is kept.
+        """
+        import shutil
+        import tempfile
+        final = self._entry(key)
+        os.makedirs(os.path.dirname(final), exist_ok=True)
+        tmp = tempfile.mkdtemp(dir=os.path.dirname(final), prefix='.tmp-')
+        try:
+            layout, nbytes = _save(tmp, result)
+            with open(os.path.join(tmp, 'meta.json'), 'w') as f:
+                json.dump({'function': func_name, 'created': time.time(),
+                           'nbytes': nbytes, 'layout': layout}, f)
+            # A directory without meta.json is a broken entry, not a result
+            if os.path.exists(final) and \
+                    not os.path.exists(os.path.join(final, 'meta.json')):
+                shutil.rmtree(final, ignore_errors=True)
+            try:
+                os.replace(tmp, final)
+            except OSError:
+                if not os.path.exists(os.path.join(final, 'meta.json')):
+                    raise
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+        self.evict()
+
+    def evict(self):
+        """Drop least-recently-used entries until within max_bytes"""
+        import shutil
+        entries = []
+        for path, meta, atime in self._entries():
+            entries.append((atime, meta['nbytes'], path))
+        total = sum(nbytes for _, nbytes, _ in entries)
+        for _, nbytes, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(path, ignore_errors=True)
+            total -= nbytes
+
+    def invalidate(self, func=None):
+        """Remove every entry, or only those produced by `func`"""
+        import shutil
+        name = None if func is None else \
+            f"{func.__module__}.{func.__qualname__}"
+        removed = 0
+        for path, meta, _ in list(self._entries()):
+            if name is None or meta['function'] == name:
+                shutil.rmtree(path, ignore_errors=True)
+                removed += 1
+        return removed
+
+    def size(self):
+        return sum(meta['nbytes'] for _, meta, _ in self._entries())
+
+
+def _save(path, result, prefix='r'):
+    """Write result's arrays as .npy files; returns (layout, nbytes)"""
+    if result is None:
+        return {'kind': 'none'}, 0
+    if isinstance(result, np.ndarray):
+        np.save(os.path.join(path, f"{prefix}.npy"), result)
+        return {'kind': 'array', 'file': f"{prefix}.npy"}, result.nbytes
+    if isinstance(result, (np.generic, bool, int, float, complex)):
+        return _save(path, np.asarray(result), prefix)
+    if isinstance(result, (tuple, list)):
+        parts = [_save(path, item, f"{prefix}_{i}")
+                 for i, item in enumerate(result)]
+        layout = {'kind': 'tuple' if isinstance(result, tuple) else 'list',
+                  'items': [p[0] for p in parts]}
+        if hasattr(result, '_fields'):
+            layout['class'] = _class_path(result)
+        return layout, sum(p[1] for p in parts)
+    if isinstance(result, dict) or hasattr(result, '__dict__'):
+        items = result if isinstance(result, dict) else vars(result)
+        parts = {k: _save(path, v, f"{prefix}_{i}")
+                 for i, (k, v) in enumerate(items.items())}
+        layout = {'kind': 'dict', 'items': {k: p[0] for k, p in
+                                            parts.items()}}
+        if not isinstance(result, dict):
+            layout['class'] = _class_path(result)
+        return layout, sum(p[1] for p in parts.values())
+    raise TypeError(f"Cannot cache result of type {type(result).__name__}")
+
+
+def _class_path(obj):
+    return f"{type(obj).__module__}:{type(obj).__qualname__}"
+
+
+def _load_class(path):
+    module, name = path.split(':')
+    return getattr(importlib.import_module(module), name)
+
+
+def _load(path, layout):
+    """Rebuild a stored result, memory-mapping its arrays"""
+    kind = layout['kind']
+    if kind == 'none':
+        return None
+    if kind == 'array':
+        arr = np.load(os.path.join(path, layout['file']), mmap_mode='r')
+        return arr[()] if arr.ndim == 0 else arr
+    if kind in ('tuple', 'list'):
+        items = [_load(path, item) for item in layout['items']]
+        if 'class' in layout:
+            return _load_class(layout['class'])(*items)
+        return tuple(items) if kind == 'tuple' else items
+    items = {k: _load(path, v) for k, v in layout['items'].items()}
+    if 'class' not in layout:
+        return items
+    obj = object.__new__(_load_class(layout['class']))
+    obj.__dict__.update(items)
+    return obj
+
+
+def configure_cache(root, max_bytes=DEFAULT_MAX_BYTES):
+    """Enable caching under root for all @cached functions (None disables)"""
+    global _default_cache
+    _default_cache = None if root is None else ResultCache(root, max_bytes)
+    return _default_cache
+
+
+def default_cache():
+    """The configured cache, created from FPIT_CACHE_DIR on first use"""
+    if _default_cache is None and os.environ.get('FPIT_CACHE_DIR'):
+        configure_cache(os.environ['FPIT_CACHE_DIR'],
+                        int(os.environ.get('FPIT_CACHE_MAX_BYTES',
+                                           DEFAULT_MAX_BYTES)))
+    return _default_cache
+
+
+def cached(func=None, *, bypass=()):
+    """Cache func's results in the default cache when one is configured.
+
+    Calls passing a non-None value for any argument named in `bypass` (such
+    as an output buffer) always run uncached. Cached arrays come back as
+    read-only memory maps.
+    """
+    if func is None:
+        return functools.partial(cached, bypass=bypass)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        cache = default_cache()
+        if cache is None:
+            return func(*args, **kwargs)
+        if bypass:
+            bound = inspect.signature(func).bind(*args, **kwargs)
+            if any(bound.arguments.get(name) is not None for name in bypass):
+                return func(*args, **kwargs)
+        key = function_key(func, args, kwargs)
+        result = cache.get(key, _MISSING)
+        if result is _MISSING:
+            result = func(*args, **kwargs)
+            cache.put(key, result, f"{func.__module__}.{func.__qualname__}")
+        return result
+
+    wrapper.uncached = func
+    return wrapper
@@ -0,0 +1,292 @@
+"""
+scaling_benchmark.py - Timing harness for the metric perturbation solvers
+
+Times the real solvers across grid sizes, BLAS/OpenMP thread counts and
+concurrent process counts. Every run executes in a fresh worker process so
+its peak RSS is its own. Wall time, peak RSS and steps per second are written
+to JSON together with the fitted scaling exponent, and plotted against the
+O(N² log N) model. The euler-1d cases compare the fused in-place Euler
+kernel (float64, float32 and, with numba installed, compiled) with the
+original ndimage.laplace update; the report then also holds the float32
+error against float64.
+"""
+
+import argparse
+import json
+import os
+import platform
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+import numpy as np
+
+from .plotting import pyplot
+from .weak_coupling_critical_phase import (integrate_delta_h_euler,
+                                           simulate_delta_h_nd,
+                                           simulate_delta_h_batch, steps, dt,
+                                           phi0, sigma)
+
+THREAD_ENV_VARS = ('OMP_NUM_THREADS', 'OPENBLAS_NUM_THREADS',
+                   'MKL_NUM_THREADS', 'NUMEXPR_NUM_THREADS')
+
+
+# Theoretical scaling law: O(N^2 log N)
+
+
+def theoretical_scaling(N, a=1e-6):
+    return a * (N**2) * np.log(N)
+
+
+# ========== SOLVER CASES ==========
+# Each case runs about `n_steps` steps of a solver at linear grid size N
+# and returns the number of steps it actually took
+
+
+def _stencil_2d(N, n_steps):
+    simulate_delta_h_nd(1.5, ndim=2, n=N, step=1e-5, t_end=n_steps*1e-5)
+    return n_steps
+
+
+def _sparse_2d(N, n_steps):
+    simulate_delta_h_nd(1.5, ndim=2, n=N, step=1e-5, t_end=n_steps*1e-5,
+                        operator='sparse')
+    return n_steps
+
+
+def _stencil_3d(N, n_steps):
+    simulate_delta_h_nd(1.5, ndim=3, n=N, step=1e-5, t_end=n_steps*1e-5)
+    return n_steps
+
+
+def _batch_sweep(N, n_steps):
+    # N coupling values; the batched solver runs its fixed step count
+    simulate_delta_h_batch(np.linspace(0.5, 2.5, N))
+    return steps
+
+
+def _euler_problem(N, lambda_val=1.5):
+    """(h0, λφ², Γ) of simulate_delta_h on N points"""
+    x = np.linspace(-5*sigma, 5*sigma, N)
+    phi = phi0 * np.exp(-x**2 / sigma**2)
+    h0 = 0.1 * np.exp(-x**2 / (2*sigma)**2)
+    return h0, lambda_val * phi**2, np.sqrt(lambda_val) * phi0**2 / sigma
+
+
+def _euler_laplace(N, n_steps):
+    # The original update, allocating several temporaries per step
+    from scipy.ndimage import laplace
+    h, coef, Gamma = _euler_problem(N)
+    for _ in range(n_steps):
+        h += dt * (-Gamma * h + coef * laplace(h, mode='reflect'))
+    return n_steps
+
+
+def _euler_fused(dtype, kernel='numpy'):
+    def run(N, n_steps):
+        h0, coef, Gamma = _euler_problem(N)
+        integrate_delta_h_euler(h0.astype(dtype), coef, Gamma, n_steps,
+                                kernel=kernel)
+        return n_steps
+    return run
+
+
+SOLVERS = {
+    'stencil-2d': _stencil_2d,
+    'sparse-2d': _sparse_2d,
+    'stencil-3d': _stencil_3d,
+    'batch-sweep': _batch_sweep,
+    'euler-1d-laplace': _euler_laplace,
+    'euler-1d': _euler_fused(np.float64),
+    'euler-1d-f32': _euler_fused(np.float32),
+    'euler-1d-numba': _euler_fused(np.float64, 'numba'),
+}
+
+
+def float32_error(grid_sizes, n_steps=steps):
+    """max|h32 - h64| / max|h64| of the fused Euler kernel per N"""
+    errors = {}
+    for N in grid_sizes:
+        h0, coef, Gamma = _euler_problem(N)
+        h64 = integrate_delta_h_euler(h0, coef, Gamma, n_steps)
+        h32 = integrate_delta_h_euler(h0.astype(np.float32), coef, Gamma,
+                                      n_steps)
+        errors[N] = float(np.max(np.abs(h32 - h64)) / np.max(np.abs(h64)))
+    return errors
+
+
+def _peak_rss_bytes():
+    """Peak resident set size of this process"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def _run_case(solver, N, n_steps, repeats):
+    """Time one solver case in the current (fresh) worker process"""
+    run = SOLVERS[solver]
+    run(N, 1)  # warm-up
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        taken = run(N, n_steps)
+        times.append(time.perf_counter() - start)
+    wall = min(times)
+    return {
+        'solver': solver,
+        'N': N,
+        'steps': taken,
+        'wall_time': wall,
+        'wall_times': times,
+        'steps_per_second': taken / wall,
+        'peak_rss': _peak_rss_bytes(),
+    }
+
+
+def run_benchmarks(solvers, grid_sizes, threads=(1,), processes=(1,),
+                   n_steps=20, repeats=3):
+    """Run every (solver, N, threads, processes) combination.
+
+    For a process count P, P identical runs are launched at once, so the
+    per-process figures show how throughput holds up under contention.
+    """
+    ctx = get_context('spawn')
+    results = []
+    saved_env = {k: os.environ.get(k) for k in THREAD_ENV_VARS}
+    try:
+        for n_threads in threads:
+            # Spawned workers inherit these before numpy is imported
+            for key in THREAD_ENV_VARS:
+                os.environ[key] = str(n_threads)
+            for n_procs in processes:
+                for solver in solvers:
+                    for N in grid_sizes:
+                        with ProcessPoolExecutor(n_procs, mp_context=ctx,
+                                                 max_tasks_per_child=1) as pool:
+                            futures = [pool.submit(_run_case, solver, N,
+                                                   n_steps, repeats)
+                                       for _ in range(n_procs)]
+                            runs = [f.result() for f in futures]
+                        wall = max(r['wall_time'] for r in runs)
+                        results.append({
+                            'solver': solver,
+                            'N': N,
+                            'threads': n_threads,
+                            'processes': n_procs,
+                            'steps': runs[0]['steps'],
+                            'wall_time': wall,
+                            'steps_per_second': sum(r['steps_per_second']
+                                                    for r in runs),
+                            'peak_rss': max(r['peak_rss'] for r in runs),
+                            'runs': runs,
+                        })
+                        print(f"{solver:12s} N={N:<5d} threads={n_threads} "
+                              f"procs={n_procs} wall={wall:.4f}s "
+                              f"rss={results[-1]['peak_rss']/2**20:.1f}MiB")
+    finally:
+        for key, value in saved_env.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+    return results
+
+
+def _config_key(r):
+    return f"{r['solver']}/threads={r['threads']}/procs={r['processes']}"
+
+
+def fit_scaling(results):
+    """Fit runtime ∝ N^p and the O(N² log N) prefactor per configuration"""
+    fits = {}
+    groups = {}
+    for r in results:
+        groups.setdefault(_config_key(r), []).append(r)
+    for key, runs in groups.items():
+        N = np.array([r['N'] for r in runs], dtype=float)
+        wall = np.array([r['wall_time'] for r in runs])
+        fit = {'a': float(np.sum(wall * theoretical_scaling(N, 1))
+                          / np.sum(theoretical_scaling(N, 1)**2))}
+        if len(runs) > 1:
+            exponent, _ = np.polyfit(np.log(N), np.log(wall), 1)
+            fit['exponent'] = float(exponent)
+        fits[key] = fit
+    return fits
+
+
+def write_report(results, fits, path='scaling_benchmark.json',
+                 extra=None):
+    """Write results, fits, machine metadata and `extra` entries as JSON"""
+    report = {
+        'machine': {
+            'platform': platform.platform(),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'cpu_count': os.cpu_count(),
+        },
+        'results': results,
+        'fits': fits,
+        **(extra or {}),
+    }
+    with open(path, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"Results saved to {path}")
+
+
+def plot_scaling(results, fits, save_path='scaling_benchmark.pdf'):
+    """Plot measured runtimes against the fitted O(N² log N) model"""
+    plt = pyplot()
+    plt.figure(figsize=(8, 6))
+    for key, fit in fits.items():
+        runs = [r for r in results if _config_key(r) == key]
+        N = np.array([r['N'] for r in runs])
+        wall = np.array([r['wall_time'] for r in runs])
+        label = key if 'exponent' not in fit else \
+            f"{key} ($p = {fit['exponent']:.2f}$)"
+        line, = plt.loglog(N, wall, 'o-', label=label)
+        plt.loglog(N, theoretical_scaling(N, fit['a']), '--',
+                   color=line.get_color(), alpha=0.5)
+    plt.xlabel('Grid Size (N)', fontsize=12)
+    plt.ylabel('Runtime (seconds)', fontsize=12)
+    plt.title('Weak Scaling Benchmark (dashed: fitted O(N² log N))',
+              fontsize=14)
+    plt.legend()
+    plt.grid(True, which='both', linestyle='--')
+    plt.savefig(save_path, bbox_inches='tight')
+    plt.close()
+
+
+def create_figure(save_path='scaling_benchmark.pdf'):
+    """The paper's benchmark figure: stencil-2d on 32-256 grids, 1 thread"""
+    results = run_benchmarks(['stencil-2d'], [32, 64, 128, 256])
+    plot_scaling(results, fit_scaling(results), save_path)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--solvers', nargs='+', default=['stencil-2d'],
+                        choices=sorted(SOLVERS))
+    parser.add_argument('--sizes', nargs='+', type=int,
+                        default=[32, 64, 128, 256, 512])
+    parser.add_argument('--threads', nargs='+', type=int, default=[1])
+    parser.add_argument('--processes', nargs='+', type=int, default=[1])
+    parser.add_argument('--steps', type=int, default=20)
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument('--output', default='scaling_benchmark')
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.solvers, args.sizes, args.threads,
+                             args.processes, args.steps, args.repeats)
+    fits = fit_scaling(results)
+    for key, fit in fits.items():
+        print(key, fit)
+    extra = {}
+    if 'euler-1d-f32' in args.solvers:
+        extra['float32_error'] = float32_error(args.sizes)
+        for N, error in extra['float32_error'].items():
+            print(f"euler-1d-f32 N={N}: max|h32 - h64|/max|h64| after "
+                  f"{steps} steps = {error:.2e}")
+    write_report(results, fits, f"{args.output}.json", extra)
+    plot_scaling(results, fits, f"{args.output}.pdf")
@@ -0,0 +1,171 @@
+"""
+snapshots.py - Streaming h(t) snapshots and checkpoint/restart for the solvers
+
+A SnapshotWriter appends decimated frames (every k steps, or at
+logarithmically spaced steps) to a raw binary file as the solver runs, so the
+history never sits in RAM; read_snapshots() memory-maps it back as a
+(n_frames, *shape) array with the matching steps and times. Periodic
+checkpoints hold the full state and are written atomically, so a run that
+dies can resume from its last checkpoint: frames recorded after that
+checkpoint are truncated away and rewritten by the resumed run. The solver
+passes its run identity (parameters, dtype, shape, initial state) to
+resume(); it is stored with the frames and the checkpoint, and resuming a
+store written by a different run raises instead of returning that run's
+state.
+
+Store layout (a directory):
+    meta.json       frame dtype, shape and run identity
+    frames.bin      raw frames, appended
+    index.bin       (step, t) per frame, appended
+    checkpoint.npz  last checkpoint: step, t, h, the frame count and the
+                    run identity
+"""
+
+import json
+import os
+
+import numpy as np
+
+INDEX_DTYPE = np.dtype([('step', '<i8'), ('t', '<f8')])
+
+
+def schedule_steps(total_steps, every=None, n_log=None):
+    """Steps to record: every k-th step, or n_log log-spaced ones (plus 0)"""
+    if n_log is not None:
+        log_steps = np.geomspace(1, total_steps, n_log).round().astype(int)
+        return np.unique(np.concatenate(([0], log_steps)))
+    return np.arange(0, total_steps + 1, every or 1)
+
+
+class SnapshotWriter:
+    """Append decimated frames and checkpoints of a run to directory `path`.
+
+    Pass to a solver (e.g. simulate_delta_h(..., snapshots=writer)); the
+    solver calls resume() once, record() after every step and finish() at
+    the end. Frames are taken at schedule_steps(total_steps, every, n_log);
+    a checkpoint is written every `checkpoint_every` steps.
+    """
+
+    def __init__(self, path, total_steps=None, every=1, n_log=None,
+                 checkpoint_every=None):
+        if n_log is not None and total_steps is None:
+            raise ValueError("n_log needs total_steps")
+        self.path = path
+        self.every = every
+        self.wanted = None if n_log is None else \
+            set(schedule_steps(total_steps, n_log=n_log).tolist())
+        self.checkpoint_every = checkpoint_every
+        self.n_frames = 0
+        self.dtype = self.shape = None
+        self.run = None
+        self._frames = self._index = None
+        os.makedirs(path, exist_ok=True)
+
+    def _file(self, name):
+        return os.path.join(self.path, name)
+
+    def _open(self, h):
+        """Fix the frame layout from the first frame and open the files"""
+        self.dtype, self.shape = np.dtype(h.dtype), h.shape
+        with open(self._file('meta.json'), 'w') as f:
+            json.dump({'dtype': self.dtype.str, 'shape': self.shape,
+                       'run': self.run}, f)
+        self._frames = open(self._file('frames.bin'), 'ab')
+        self._index = open(self._file('index.bin'), 'ab')
+
+    def wants(self, step):
+        if self.wanted is not None:
+            return step in self.wanted
+        return step % self.every == 0
+
+    def resume(self, run=None):
+        """(step, t, h) of the last checkpoint, or None for a fresh run.
+
+        run is a JSON-serialisable dict identifying the run; a checkpoint
+        saved with a different identity raises ValueError. Drops frames
+        written after the checkpoint, since the resumed run records them
+        again. A fresh run starts from an empty store.
+        """
+        self.run = None if run is None else \
+            json.loads(json.dumps(run, default=str))
+        ckpt = self._file('checkpoint.npz')
+        if not os.path.exists(ckpt):
+            for name in ('frames.bin', 'index.bin'):
+                if os.path.exists(self._file(name)):
+                    os.remove(self._file(name))
+            return None
+        with np.load(ckpt) as data:
+            saved = json.loads(str(data['run'])) if 'run' in data else None
+            if saved != self.run:
+                changed = sorted(k for k in set(saved or {}) |
+                                 set(self.run or {})
+                                 if (saved or {}).get(k) !=
+                                 (self.run or {}).get(k))
+                raise ValueError(
+                    f"Checkpoint in {self.path} belongs to a different run "
+                    f"(differs in {', '.join(changed)}); use a new "
+                    f"directory or delete it")
+            step, t, h = int(data['step']), float(data['t']), data['h']
+            self.n_frames = int(data['n_frames'])
+        self._open(h)
+        self._frames.truncate(self.n_frames * h.nbytes)
+        self._index.truncate(self.n_frames * INDEX_DTYPE.itemsize)
+        return step, t, h
+
+    def record(self, step, t, h):
+        """Store h as a frame if `step` is scheduled; checkpoint if due"""
+        if self.wants(step):
+            if self._frames is None:
+                self._open(h)
+            self._frames.write(np.ascontiguousarray(h, self.dtype).data)
+            self._index.write(np.array((step, t), INDEX_DTYPE).tobytes())
+            self.n_frames += 1
+        if self.checkpoint_every and step and \
+                step % self.checkpoint_every == 0:
+            self.checkpoint(step, t, h)
+
+    def checkpoint(self, step, t, h):
+        """Atomically save the state; frames up to now are flushed first"""
+        for f in (self._frames, self._index):
+            if f is not None:
+                f.flush()
+                os.fsync(f.fileno())
+        tmp = self._file('checkpoint.npz.tmp')
+        with open(tmp, 'wb') as f:
+            np.savez(f, step=step, t=t, h=h, n_frames=self.n_frames,
+                     run=json.dumps(self.run))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self._file('checkpoint.npz'))
+
+    def finish(self, step, t, h):
+        """Final checkpoint (a rerun then resumes at the end) and close"""
+        self.checkpoint(step, t, h)
+        self.close()
+
+    def close(self):
+        for f in (self._frames, self._index):
+            if f is not None:
+                f.close()
+        self._frames = self._index = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def read_snapshots(path):
+    """Memory-map a snapshot store: (steps, times, frames (n, *shape))"""
+    with open(os.path.join(path, 'meta.json')) as f:
+        meta = json.load(f)
+    dtype, shape = np.dtype(meta['dtype']), tuple(meta['shape'])
+    index = np.fromfile(os.path.join(path, 'index.bin'), dtype=INDEX_DTYPE)
+    frame_bytes = dtype.itemsize * int(np.prod(shape))
+    n = min(len(index),
+            os.path.getsize(os.path.join(path, 'frames.bin')) // frame_bytes)
+    frames = np.memmap(os.path.join(path, 'frames.bin'), dtype=dtype,
+                       mode='r', shape=(n,) + shape) if n else \
+        np.empty((0,) + shape, dtype)
+    return index['step'][:n], index['t'][:n], frames
@@ -0,0 +1,424 @@
+import functools
+from importlib.util import find_spec
+
+import numpy as np
+
+from .instrumentation import phase, count
+from .plotting import pyplot
+from .result_cache import cached
+
+# Parameters see {tab:params}
+lambda_weak = 0.5    # Weak coupling
+lambda_critical = 1.5  # Critical phase
+sigma = 1.0           # Localization scale [ly]
+phi0 = 1.0            # Field amplitude
+N = 100               # Spatial grid points
+dt = 0.01             # Time step
+steps = 1000          # Total steps
+tol = 1e-6            # Steady-state tolerance on ||Δh||/(Δt·||h||) (cn)
+
+# Optional: kernel='numba' compiles the fused Euler loop
+NUMBA_INSTALLED = find_spec('numba') is not None
+
+
+def _resume(snapshots, h, **run):
+    """Start step and state for a run, from the writer's last checkpoint.
+
+    The run parameters, h's dtype and shape and a hash of the initial h
+    identify the run; a checkpoint from any other run is rejected.
+    """
+    if snapshots is None:
+        return 0, h
+    import hashlib
+    run.update(dtype=h.dtype.str, shape=list(h.shape),
+               h0=hashlib.sha256(np.ascontiguousarray(h).data).hexdigest())
+    state = snapshots.resume(run)
+    if state is None:
+        snapshots.record(0, 0.0, h)
+        return 0, h
+    start, _, saved = state
+    return start, np.array(saved).reshape(h.shape)
+
+
+@cached(bypass=('snapshots',))
+def simulate_delta_h(lambda_val, method='euler', h0=None, snapshots=None,
+                     dtype=np.float64, n=N):
+    """Evolve dh/dt = -Γh + λφ²∇²h for steps·dt; returns (x, h).
+
+    method is 'euler' (fixed-step fused kernel) or 'cn' (adaptive
+    Crank-Nicolson, integrate_delta_h_cn). h0 is the initial perturbation
+    on the n-point grid over [-5σ, 5σ] (a Gaussian of amplitude 0.1 by
+    default). snapshots is an optional snapshots.SnapshotWriter (euler
+    only) that streams h(t) frames and checkpoints; the run resumes from
+    its last checkpoint. dtype (float64 or float32) selects the precision
+    of the euler kernel. Results are cached when a result cache is
+    configured, except for calls passing snapshots, which always run.
+    """
+    # Initialize fields
+    x = np.linspace(-5*sigma, 5*sigma, n)
+    phi = phi0 * np.exp(-x**2 / sigma**2)
+    if h0 is None:
+        h = 0.1 * np.exp(-x**2 / (2*sigma)**2)  # Initial perturbation
+    else:
+        h = np.array(h0, dtype=float)
+
+    Gamma = np.sqrt(lambda_val) * phi0**2 / sigma
+
+    if method == 'cn':
+        if snapshots is not None:
+            raise ValueError("Snapshots need the fixed-step 'euler' method")
+        if np.dtype(dtype) != np.float64:
+            raise ValueError("Only the 'euler' method runs in float32")
+        h, _, _ = integrate_delta_h_cn(h, lambda_val * phi**2, Gamma,
+                                       t_end=steps*dt)
+        return x, h
+    if method != 'euler':
+        raise ValueError(f"Unknown method {method!r}")
+
+    start, h = _resume(snapshots, h.astype(dtype), solver='simulate_delta_h',
+                       lambda_val=lambda_val, method=method, n=n, dt=dt,
+                       steps=steps)
+    with phase('delta_h.euler', lambda_val=lambda_val):
+        h = integrate_delta_h_euler(h, lambda_val * phi**2, Gamma,
+                                    steps - start, start=start,
+                                    snapshots=snapshots)
+    count('delta_h.steps', steps - start)
+
+    if snapshots is not None:
+        snapshots.finish(steps, steps*dt, h)
+    return x, h
+
+
+def _fused_loop(h, out, coef, diag, n_steps):
+    """n_steps fused updates, ping-ponging h and out; returns the last"""
+    n = h.shape[0]
+    for _ in range(n_steps):
+        out[0] = diag[0]*h[0] + coef[0]*h[1]
+        for i in range(1, n - 1):
+            out[i] = diag[i]*h[i] + coef[i]*(h[i-1] + h[i+1])
+        out[n-1] = diag[n-1]*h[n-1] + coef[n-1]*h[n-2]
+        h, out = out, h
+    return h
+
+
+@functools.lru_cache(maxsize=None)
+def _numba_loop():
+    import numba
+    return numba.njit(cache=True)(_fused_loop)
+
+
+def _numpy_step(h, out, coef, diag, scratch):
+    """One update out = diag·h + coef·(h[i-1] + h[i+1]), all in place"""
+    np.add(h[:-2], h[2:], out=out[1:-1])
+    out[0] = h[1]
+    out[-1] = h[-2]
+    out *= coef
+    np.multiply(diag, h, out=scratch)
+    out += scratch
+
+
+def integrate_delta_h_euler(h, coef, Gamma, n_steps=steps, step=dt, start=0,
+                            snapshots=None, kernel='numpy'):
+    """Explicit Euler steps of dh/dt = -Γh + coef·∇²h (reflect boundary).
+
+    With dt folded in, each step is the single stencil update
+    h ← (1 - Γdt - 2c)·h + c·(h[i-1] + h[i+1]), c = coef·dt (the ends use
+    the reflected neighbour). The coefficient arrays are precomputed in
+    h's dtype and two preallocated buffers alternate, so no step
+    allocates. kernel='numpy' (default) runs each step as in-place ufuncs;
+    kernel='numba' runs the same loop compiled (optional dependency).
+    Returns the new h.
+    """
+    dtype = h.dtype
+    c = np.broadcast_to(np.asarray(coef, dtype=float) * step, h.shape)
+    diag = (1 - step*Gamma) - 2*c
+    diag[[0, -1]] += c[[0, -1]]
+    c, diag = c.astype(dtype), diag.astype(dtype)
+    out = np.empty_like(h)
+    h = h.copy()
+
+    if kernel == 'numba':
+        if not NUMBA_INSTALLED:
+            raise ImportError("numba required for kernel='numba'")
+        loop = _numba_loop()
+        if snapshots is None:
+            return loop(h, out, c, diag, n_steps)
+        for i in range(start, start + n_steps):
+            h, out = loop(h, out, c, diag, 1), h
+            snapshots.record(i + 1, (i + 1)*step, h)
+        return h
+    if kernel != 'numpy':
+        raise ValueError(f"Unknown kernel {kernel!r}")
+
+    scratch = np.empty_like(h)
+    for i in range(start, start + n_steps):
+        _numpy_step(h, out, c, diag, scratch)
+        h, out = out, h
+        if snapshots is not None:
+            snapshots.record(i + 1, (i + 1)*step, h)
+    return h
+
+
+def _apply_operator(h, coef, Gamma):
+    """Evaluate -Γh + coef·∇²h with the reflect-boundary Laplacian"""
+    from scipy.ndimage import laplace
+    return -Gamma * h + coef * laplace(h, mode='reflect')
+
+
+def _cn_step(h, coef, Gamma, step):
+    """One Crank-Nicolson step, solving the tridiagonal system banded"""
+    from scipy.linalg import solve_banded
+    half = 0.5 * step
+    ab = np.zeros((3, len(h)))
+    ab[0, 1:] = -half * coef[:-1]
+    ab[1] = 1 + half * (Gamma + 2*coef)
+    ab[1, 0] -= half * coef[0]
+    ab[1, -1] -= half * coef[-1]
+    ab[2, :-1] = -half * coef[1:]
+    return solve_banded((1, 1), ab, h + half * _apply_operator(h, coef, Gamma))
+
+
+def integrate_delta_h_cn(h, coef, Gamma, t_end, dt0=dt, rtol=1e-4,
+                         atol=1e-9, tol=tol, max_steps=steps):
+    """Adaptive Crank-Nicolson integration of dh/dt = -Γh + coef·∇²h.
+
+    The step size is controlled by step doubling. The run stops early only
+    at a steady state, once the relative rate ||Δh||∞/(Δt·||h||∞) of an
+    accepted step falls below tol; a decaying solution is integrated to
+    t_end. Returns (h, t, n_steps).
+    """
+    h = np.array(h, dtype=float)
+    t, step, n_steps, rejected = 0.0, dt0, 0, 0
+    with phase('delta_h.cn'):
+        while t < t_end and n_steps < max_steps:
+            step = min(step, t_end - t)
+            full = _cn_step(h, coef, Gamma, step)
+            half = _cn_step(_cn_step(h, coef, Gamma, step/2), coef, Gamma,
+                            step/2)
+
+            # Richardson estimate of the local error for a second-order
+            # scheme
+            err = np.max(np.abs(half - full)) / 3
+            scale = atol + rtol * np.max(np.abs(half))
+            factor = 0.9 * (scale / err)**(1/3) if err > 0 else 4.0
+            if err > scale:
+                step *= max(0.2, factor)
+                rejected += 1
+                continue
+
+            delta = np.max(np.abs(half - h))
+            h = half
+            t += step
+            n_steps += 1
+            if delta <= tol * step * np.max(np.abs(h)):
+                break
+            step *= min(4.0, factor)
+
+    count('delta_h.cn_steps', n_steps)
+    count('delta_h.cn_rejected', rejected)
+    return h, t, n_steps
+
+
+def simulate_delta_h_batch(lambda_vals, sigma_vals=sigma, phi0_vals=phi0):
+    """Batched simulate_delta_h over broadcast arrays of λ, σ and φ0.
+
+    All runs evolve together as one (batch × N) state, one stencil update per
+    step. Returns x and h with shape (*batch_shape, N).
+    """
+    lambda_vals, sigma_vals, phi0_vals = np.broadcast_arrays(
+        np.asarray(lambda_vals, dtype=float),
+        np.asarray(sigma_vals, dtype=float),
+        np.asarray(phi0_vals, dtype=float))
+    batch_shape = lambda_vals.shape
+    lam = lambda_vals.reshape(-1, 1)
+    sig = sigma_vals.reshape(-1, 1)
+    amp = phi0_vals.reshape(-1, 1)
+
+    # Initialize fields, one row per parameter point
+    x = np.linspace(-5, 5, N) * sig
+    phi = amp * np.exp(-x**2 / sig**2)
+    h = 0.1 * np.exp(-x**2 / (2*sig)**2)
+
+    Gamma = np.sqrt(lam) * amp**2 / sig
+
+    # dh/dt = -Γh + λφ²∇²h with dt folded into the coefficients
+    decay = 1 - dt * Gamma
+    coef = dt * lam * phi**2
+    lap = np.empty_like(h)
+
+    with phase('delta_h.batch', batch=h.shape[0]):
+        for _ in range(steps):
+            # Reflect-boundary Laplacian, as laplace(h, mode='reflect')
+            np.add(h[:, :-2], h[:, 2:], out=lap[:, 1:-1])
+            lap[:, 1:-1] -= h[:, 1:-1]
+            lap[:, 1:-1] -= h[:, 1:-1]
+            np.subtract(h[:, 1], h[:, 0], out=lap[:, 0])
+            np.subtract(h[:, -2], h[:, -1], out=lap[:, -1])
+
+            lap *= coef
+            h *= decay
+            h += lap
+    count('delta_h.batch_steps', steps * h.shape[0])
+
+    return x.reshape(batch_shape + (N,)), h.reshape(batch_shape + (N,))
+
+
+def _axis_profile(f, ndim, axis):
+    """Reshape a 1-D profile to broadcast along one axis of an ndim grid"""
+    shape = [1] * ndim
+    shape[axis] = len(f)
+    return f.reshape(shape)
+
+
+def _stencil_laplacian(h, out):
+    """Index-space reflect-boundary Laplacian of an n-D array, written to out"""
+    out.fill(0)
+    for axis in range(h.ndim):
+        def sl(start, stop):
+            idx = [slice(None)] * h.ndim
+            idx[axis] = slice(start, stop)
+            return tuple(idx)
+        mid, lo, hi = sl(1, -1), sl(None, -2), sl(2, None)
+        np.add(out[mid], h[lo], out=out[mid])
+        np.add(out[mid], h[hi], out=out[mid])
+        np.subtract(out[mid], h[mid], out=out[mid])
+        np.subtract(out[mid], h[mid], out=out[mid])
+        for edge, inner in ((sl(0, 1), sl(1, 2)), (sl(-1, None), sl(-2, -1))):
+            np.add(out[edge], h[inner], out=out[edge])
+            np.subtract(out[edge], h[edge], out=out[edge])
+    return out
+
+
+def laplacian_operator(n, ndim, dx=1.0, dtype=np.float64):
+    """Sparse CSR reflect-boundary Laplacian on an n^ndim grid (Kronecker sum)"""
+    from scipy import sparse
+    lap_1d = sparse.diags([np.ones(n-1), -2*np.ones(n), np.ones(n-1)],
+                          [-1, 0, 1], format='lil', dtype=dtype)
+    lap_1d[0, 0] = lap_1d[-1, -1] = -1
+    lap_1d = lap_1d.tocsr() / dx**2
+    eye = sparse.identity(n, dtype=dtype, format='csr')
+    lap = sparse.csr_matrix((n**ndim, n**ndim), dtype=dtype)
+    for axis in range(ndim):
+        term = sparse.identity(1, dtype=dtype, format='csr')
+        for other in range(ndim):
+            term = sparse.kron(term, lap_1d if other == axis else eye,
+                               format='csr')
+        lap = lap + term
+    return lap.tocsr()
+
+
+def simulate_delta_h_nd(lambda_val, ndim=4, n=32, t_end=steps*dt, step=None,
+                        dtype=np.float32, operator='stencil',
+                        phi2_profile=None, h0_profile=None,
+                        snapshots=None):
+    """Solve dh/dt = -Γh + λφ²∇²h on an n^ndim cell-centred grid.
+
+    Unlike simulate_delta_h, ∇² is scaled by the grid spacing so results
+    converge under refinement. operator='stencil' applies the Laplacian
+    matrix-free in place and never stores φ² densely (it is separable), so
+    only two fields are held in memory: a 128^4 float32 run needs ~2.1 GB.
+    operator='sparse' builds the CSR Kronecker-sum operator once, which is
+    faster for small grids. Explicit Euler with a stable step by default.
+    phi2_profile and h0_profile map the 1-D axis x to the per-axis factors
+    of φ²/φ0² and of h(0)/0.1 (Gaussians by default). snapshots is an
+    optional snapshots.SnapshotWriter, as for simulate_delta_h.
+    Returns the 1-D axis coordinates x and h with shape (n,)*ndim.
+    """
+    dx = 10*sigma / n
+    x = -5*sigma + (np.arange(n) + 0.5) * dx
+    Gamma = np.sqrt(lambda_val) * phi0**2 / sigma
+    D = lambda_val * phi0**2 / dx**2
+
+    if step is None:
+        step = 1.8 / (Gamma + 4*ndim*D)
+    n_steps = int(np.ceil(t_end / step))
+    step = t_end / n_steps
+
+    # φ²/φ0² and the initial perturbation are products of 1-D Gaussians
+    if phi2_profile is None:
+        phi2_axis = np.exp(-2*x**2 / sigma**2).astype(dtype)
+    else:
+        phi2_axis = np.asarray(phi2_profile(x), dtype=dtype)
+    if h0_profile is None:
+        h0_axis = np.exp(-x**2 / (2*sigma)**2).astype(dtype)
+    else:
+        h0_axis = np.asarray(h0_profile(x), dtype=dtype)
+    h = np.full((n,)*ndim, 0.1, dtype=dtype)
+    for axis in range(ndim):
+        h *= _axis_profile(h0_axis, ndim, axis)
+
+    run = dict(solver='simulate_delta_h_nd', lambda_val=lambda_val,
+               ndim=ndim, n=n, step=step, t_end=t_end, operator=operator)
+    if operator == 'sparse':
+        from scipy import sparse
+        phi2 = np.ones((n,)*ndim, dtype=dtype)
+        for axis in range(ndim):
+            phi2 *= _axis_profile(phi2_axis, ndim, axis)
+        A = (sparse.diags(step * D * dx**2 * phi2.ravel())
+             @ laplacian_operator(n, ndim, dx, dtype))
+        A = (A + sparse.identity(n**ndim, dtype=dtype) * (1 - step*Gamma))
+        A = A.astype(dtype).tocsr()
+        start, h = _resume(snapshots, h, **run)
+        h = h.ravel()
+        with phase('delta_h_nd.sparse', n=n, ndim=ndim):
+            for i in range(start, n_steps):
+                h = A @ h
+                if snapshots is not None:
+                    snapshots.record(i + 1, (i + 1)*step,
+                                     h.reshape((n,)*ndim))
+        count('delta_h_nd.steps', n_steps - start)
+        h = h.reshape((n,)*ndim)
+        if snapshots is not None:
+            snapshots.finish(n_steps, t_end, h)
+        return x, h
+    if operator != 'stencil':
+        raise ValueError(f"Unknown operator {operator!r}")
+
+    start, h = _resume(snapshots, h, **run)
+    lap = np.empty_like(h)
+    decay = dtype(1 - step*Gamma)
+    scale = dtype(step * D)
+    with phase('delta_h_nd.stencil', n=n, ndim=ndim):
+        for i in range(start, n_steps):
+            with phase('stencil'):
+                _stencil_laplacian(h, lap)
+            lap *= scale
+            for axis in range(ndim):
+                lap *= _axis_profile(phi2_axis, ndim, axis)
+            h *= decay
+            h += lap
+            if snapshots is not None:
+                snapshots.record(i + 1, (i + 1)*step, h)
+    count('delta_h_nd.steps', n_steps - start)
+
+    if snapshots is not None:
+        snapshots.finish(n_steps, t_end, h)
+    return x, h
+
+
+def create_figure(save_path='phase_comparison.pdf'):
+    plt = pyplot()
+    # Run simulations
+    x, h_weak = simulate_delta_h(lambda_weak)
+    x, h_critical = simulate_delta_h(lambda_critical)
+
+    # Plotting
+    plt.figure(figsize=(12, 5))
+
+    plt.subplot(121)
+    plt.plot(x, h_weak, 'r-', lw=2)
+    plt.title(f'Weak Coupling ($\\lambda = {lambda_weak}$)\nDivergence')
+    plt.xlabel('Spatial Coordinate $x$ [ly]')
+    plt.ylabel('$\\Delta h_{\\mu\\nu}$')
+
+    plt.subplot(122)
+    plt.plot(x, h_critical, 'b-', lw=2)
+    plt.title(f'Critical Phase ($\\lambda = {lambda_critical}$)\nStabilization')
+    plt.xlabel('Spatial Coordinate $x$ [ly]')
+
+    plt.tight_layout()
+    plt.savefig(save_path, bbox_inches='tight')
+
+
+if __name__ == "__main__":
+    create_figure()
@@ -1,83 +0,0 @@
-import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-
-# Configure style
-sns.set_style("whitegrid")
-plt.rcParams.update({"font.size": 12, "font.family": "serif"})
-
-# Generate synthetic data matching paper's regimes
-lambda_vals = np.linspace(0.5, 2.5, 500)
-delta_h = np.zeros_like(lambda_vals)
-
-# Paper's described regimes:
-# 1. Weak coupling (λ < 1): High perturbations ~0.1
-# 2. Critical phase (1 ≤ λ ≤ 1.5): Stabilization to <1e-3
-# 3. Strong constraints (λ > 1.5): Topological locking ~1e-4
-
-# Theoretical model
-weak_mask = lambda_vals < 1
-critical_mask = (lambda_vals >= 1) & (lambda_vals <= 1.5)
-strong_mask = lambda_vals > 1.5
-
-# Base metric perturbations
-delta_h[weak_mask] = 0.1 * (1 + 0.2*np.random.randn(sum(weak_mask)))
-delta_h[critical_mask] = 1e-3 * np.exp(-8*(lambda_vals[critical_mask] - 1))
-delta_h[strong_mask] = 1e-4 * (1 + 0.1*np.random.randn(sum(strong_mask)))
-
-# Add measurement noise (matches paper's numerical error estimates)
-noise_levels = np.where(
-    lambda_vals < 1,
-    0.02,
-    np.where(
-        lambda_vals <= 1.5,
-        0.001,
-        0.0001
-    )
-)
-noise = noise_levels * np.random.randn(len(lambda_vals))
-delta_h += noise
-
-# Compute confidence intervals using 1000 trials (matches paper's Monte Carlo)
-n_trials = 1000
-delta_h_trials = np.zeros((n_trials, len(lambda_vals)))
-
-for i in range(n_trials):
-    trial_noise = noise_levels * np.random.randn(len(lambda_vals))
-    delta_h_trials[i] = delta_h + trial_noise
-
-mean_dh = np.mean(delta_h_trials, axis=0)
-std_dh = np.std(delta_h_trials, axis=0)
-
-# Create figure
-fig, ax = plt.subplots(figsize=(10, 6))
-
-# Plot mean and confidence intervals
-ax.plot(lambda_vals, mean_dh, color='#2c7bb6', lw=2,
-        label=r"Mean $\Delta h_{tt}$")
-ax.fill_between(lambda_vals,
-                mean_dh - 2*std_dh,
-                mean_dh + 2*std_dh,
-                color='#abd9e9', alpha=0.3,
-                label="95% CI")
-
-# Critical thresholds
-ax.axvline(1, color='#d7191c', ls='--', lw=1.5,
-           label=r"Critical Phase ($\lambda=1$)")
-ax.axvline(1.5, color='#fdae61', ls='--', lw=1.5,
-           label=r"Topological Locking ($\lambda=1.5$)")
-
-# Formatting
-ax.set(
-    xlabel=r"Coupling Strength $\lambda$",
-    ylabel=r"Metric Perturbation $\Delta h_{tt}$",
-    yscale="log",
-    ylim=(1e-5, 0.2),
-    xlim=(0.5, 2.5),
-    title="Metric Rigidity Phase Diagram"
-)
-ax.legend(loc="upper right", frameon=True)
-ax.grid(True, which="both", ls="--")
-
-plt.tight_layout()
-plt.savefig("metric_rigidity.pdf", bbox_inches="tight")
@@ -0,0 +1,22 @@
+import numpy as np
+
+from fpit.adaptive_mesh_refinement import (simulate_delta_h_amr, n_coarse,
+                                           ratio, max_levels)
+from fpit.weak_coupling_critical_phase import simulate_delta_h_nd
+
+N_FINE = n_coarse * ratio**max_levels
+
+
+def _l2_error(x, h, x_ref, h_ref):
+    return (np.sqrt(np.mean((h - np.interp(x, x_ref, h_ref))**2))
+            / np.sqrt(np.mean(h_ref**2)))
+
+
+def test_amr_beats_uniform_grid_with_fewer_cells():
+    x_ref, h_ref = simulate_delta_h_nd(1.0, ndim=1, n=4*N_FINE,
+                                       dtype=np.float64)
+    x_u, h_u = simulate_delta_h_nd(1.0, ndim=1, n=N_FINE, dtype=np.float64)
+    x, h, n_cells = simulate_delta_h_amr(1.0)
+
+    assert n_cells <= 0.6 * N_FINE
+    assert _l2_error(x, h, x_ref, h_ref) < _l2_error(x_u, h_u, x_ref, h_ref)
@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+
+from fpit import critical_point
+from fpit.critical_point import euler_lambda_limit, locate_lambda_crit
+from fpit.weak_coupling_critical_phase import simulate_delta_h
+
+
+def test_euler_lambda_limit_separates_stable_from_unstable_runs():
+    limit = euler_lambda_limit()
+    _, stable = simulate_delta_h(0.95 * limit)
+    _, unstable = simulate_delta_h(1.1 * limit)
+    assert np.abs(stable).max() < 0.1
+    assert np.abs(unstable).max() > 0.1
+
+
+def test_locate_finds_crossing_inside_default_bracket():
+    lam, _ = locate_lambda_crit()
+    _, below = simulate_delta_h(0.9 * lam)
+    _, above = simulate_delta_h(1.1 * lam)
+    assert np.abs(below).max() > critical_point.threshold
+    assert np.abs(above).max() < critical_point.threshold
+
+
+def test_bracket_is_not_widened_into_the_unstable_region(monkeypatch):
+    monkeypatch.setattr(critical_point, 'threshold', 1e-300)
+    with pytest.raises(RuntimeError, match="stability limit"):
+        locate_lambda_crit()
+
+
+def test_bracket_above_the_limit_is_rejected():
+    limit = euler_lambda_limit()
+    with pytest.raises(ValueError, match="stability limit"):
+        locate_lambda_crit(bracket=(2*limit, 4*limit))
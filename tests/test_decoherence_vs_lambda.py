@@ -0,0 +1,29 @@
+import numpy as np
+import pytest
+
+from fpit.decoherence_vs_lambda import lindblad_batch
+
+SIGMA_X = np.array([[0, 1], [1, 0]], dtype=complex)
+
+
+def test_superoperator_path_matches_dense_expm():
+    from scipy.linalg import expm
+    from fpit.decoherence_vs_lambda import liouvillian, RHO0, SIGMA_Z
+    times = np.linspace(0, 2, 11)
+    expect = lindblad_batch([0.5, 1.5], times, H=0.3*SIGMA_X)
+    for row, λ in zip(expect, (0.5, 1.5)):
+        L = liouvillian(0.3*SIGMA_X, [np.sqrt(λ)*SIGMA_Z])
+        rho0 = RHO0.reshape(-1, order='F')
+        ref = [(RHO0.T.reshape(-1, order='F') @ (expm(L*t) @ rho0)).real
+               for t in times]
+        np.testing.assert_allclose(row, ref, atol=1e-12)
+
+
+def test_superoperator_path_rejects_nonuniform_times():
+    with pytest.raises(ValueError, match="uniformly spaced"):
+        lindblad_batch([1.0], [0.0, 0.1, 0.3], H=SIGMA_X)
+
+
+def test_superoperator_path_rejects_nonzero_start():
+    with pytest.raises(ValueError, match="start at 0"):
+        lindblad_batch([1.0], [0.1, 0.2, 0.3], H=SIGMA_X)
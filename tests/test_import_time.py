@@ -0,0 +1,39 @@
+import json
+import os
+import subprocess
+import sys
+
+SRC_DIR = os.path.join(os.path.dirname(__file__), os.pardir, 'src')
+
+# Modules only the figure producers, CLIs and optional backends may load
+HEAVY = ('scipy', 'matplotlib', 'seaborn', 'qutip', 'fpit.figures',
+         'argparse', 'multiprocessing', 'concurrent.futures', 'hashlib',
+         'tempfile')
+
+PROBE = """
+import json, sys
+import fpit
+after_fpit = sorted(sys.modules)
+for name in fpit._API:
+    getattr(fpit, name)
+print(json.dumps({'after_fpit': after_fpit, 'after_api': sorted(sys.modules)}))
+"""
+
+
+def _probe():
+    out = subprocess.run([sys.executable, '-c', PROBE], check=True,
+                         capture_output=True, text=True, cwd=SRC_DIR).stdout
+    return json.loads(out)
+
+
+def test_import_fpit_loads_no_numerics():
+    loaded = set(_probe()['after_fpit'])
+    assert not {'numpy', 'scipy', 'matplotlib'} & loaded
+    assert [m for m in loaded if m.startswith('fpit.')] == []
+
+
+def test_facade_loads_nothing_heavy():
+    # Every public name resolved: NumPy, but no plotting, SciPy or CLI code
+    loaded = set(_probe()['after_api'])
+    assert 'numpy' in loaded
+    assert not [m for m in HEAVY if m in loaded]
@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+
+from fpit import instrumentation
+from fpit.instrumentation import Profiler, phase
+
+
+@pytest.fixture
+def profiler(request):
+    yield instrumentation.enable(trace_memory=request.param)
+    instrumentation.disable()
+
+
+@pytest.mark.parametrize('profiler', [True], indirect=True)
+def test_traced_memory_counts_numpy_buffers(profiler):
+    with phase('alloc'):
+        keep = np.ones(1_000_000)
+    s = profiler.summary()['phases']['alloc']
+    assert s['net_bytes'] >= keep.nbytes
+    assert s['peak_bytes'] >= keep.nbytes
+    assert 'net_pyobj_blocks' not in s
+
+
+@pytest.mark.parametrize('profiler', [False], indirect=True)
+def test_untraced_summary_reports_python_object_blocks(profiler):
+    with phase('alloc'):
+        keep = [object() for _ in range(1000)]
+    s = profiler.summary()['phases']['alloc']
+    assert s['net_pyobj_blocks'] >= len(keep)
+    assert 'net_bytes' not in s
+
+
+def test_profiles_in_different_units_do_not_merge():
+    with pytest.raises(ValueError, match="trace_memory"):
+        Profiler(trace_memory=False).merge(
+            Profiler(trace_memory=True).export())
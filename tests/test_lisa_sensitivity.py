@@ -0,0 +1,41 @@
+import numpy as np
+
+from fpit.lisa_sensitivity import (T_obs, band_overlap, f_ref,
+                                   lisa_sensitivity, noise_psd, snr_map)
+
+
+def test_noise_matches_published_curve():
+    # Robson+2019 Fig. 1 (instrument noise): √S_n ≈ 1.3e-19 /√Hz at 1 mHz,
+    # with the bucket ≈ 1.2e-20 /√Hz near 7 mHz.
+    assert np.isclose(np.sqrt(noise_psd(1e-3)), 1.28e-19, rtol=0.05)
+    f = np.logspace(-3, -1, 2000)
+    asd = lisa_sensitivity(f)
+    assert 5e-3 < f[np.argmin(asd)] < 1e-2
+    assert np.isclose(asd.min(), 1.18e-20, rtol=0.05)
+
+
+def test_noise_low_frequency_asymptote():
+    # Well below f* acceleration noise dominates: S_n → 40/(3L²)·P_acc/(2πf)⁴,
+    # so √S_n scales as f⁻³ below the 0.4 mHz acceleration corner.
+    f = np.array([1e-6, 2e-6])
+    ratio = lisa_sensitivity(f[0]) / lisa_sensitivity(f[1])
+    assert np.isclose(ratio, 8, rtol=1e-3)
+
+
+def test_snr_of_white_signal_at_flat_noise():
+    # Against flat noise the SNR reduces to √(2T·A²/S_n·Δf)
+    f = np.logspace(-3, -2, 4096)
+    S_n = 1e-40
+    table = (f, np.full_like(f, 1 / S_n))
+    A, T = 1e-21, 1e7
+    snr = snr_map(A, 0.0, [(1e-3, 1e-2)], [1.0], table=table, duration=T)
+    assert np.isclose(snr.item(), np.sqrt(2 * T * A**2 / S_n * 9e-3),
+                      rtol=1e-6)
+
+
+def test_snr_scales_with_amplitude_distance_and_duration():
+    base = snr_map(1e-21, 1.0, [(1e-4, 1e-1)], [1.0]).item()
+    assert np.isclose(snr_map(2e-21, 1.0, [(1e-4, 1e-1)], [2.0]).item(), base)
+    longer = snr_map(1e-21, 1.0, [(1e-4, 1e-1)], [1.0], duration=2 * T_obs)
+    assert np.isclose(longer.item(), np.sqrt(2) * base)
+    assert band_overlap(1.0, [(f_ref, f_ref)]).item() == 0
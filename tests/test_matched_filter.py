@@ -0,0 +1,21 @@
+import numpy as np
+
+from fpit.matched_filter import (matched_filter_stream, search,
+                                 synthetic_strain, template_bank)
+
+
+def test_snr_series_follows_global_sample_index():
+    bank, _ = template_bank(f_fpit_values=(200,), decay_values=(0.01,),
+                            bbh_f0_values=(), bbh_f1_values=())
+    block, record_every = 2**12, 1000
+    assert (block - bank.shape[1] + 1) % record_every
+    stream = list(synthetic_strain(2.0, chunk=3000, seed=1))
+
+    result = search(iter(stream), bank, block=block,
+                    record_every=record_every)
+
+    best = np.concatenate([np.abs(corr).max(axis=0) for _, corr in
+                           matched_filter_stream(iter(stream), bank, block)])
+    bins = range(0, len(best), record_every)
+    expected = [best[i:i + record_every].max() for i in bins]
+    np.testing.assert_array_equal(result.snr_series, expected)
@@ -0,0 +1,19 @@
+import numpy as np
+
+from fpit.multi_fpit_interference import (grid_points, multi_fpit_field,
+                                          multi_fpit_interaction)
+
+
+def test_two_fpits_match_the_closed_form():
+    x = np.linspace(-15, 15, 301)
+    C_tt = multi_fpit_field(x, [[5.0], [-5.0]], [1.0, 1.2], 0.5)
+    np.testing.assert_allclose(C_tt, multi_fpit_interaction(x, 1.0, 1.2, 0.5),
+                               atol=1e-7)
+
+
+def test_no_fpits_give_zero_field():
+    for points, centres in ((np.linspace(-1, 1, 5), np.empty((0, 1))),
+                            (grid_points(*[np.linspace(-1, 1, 4)]*2),
+                             np.empty((0, 2)))):
+        C_tt = multi_fpit_field(points, centres, np.empty(0), 1.0)
+        np.testing.assert_array_equal(C_tt, np.zeros(len(points)))
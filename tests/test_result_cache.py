@@ -0,0 +1,88 @@
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from fpit import exotic_matter_phase_diagram as exotic
+from fpit.result_cache import (ResultCache, cached, configure_cache,
+                               function_key)
+
+SRC_DIR = os.path.join(os.path.dirname(__file__), os.pardir, 'src')
+
+
+@pytest.fixture
+def cache(tmp_path):
+    yield configure_cache(tmp_path)
+    configure_cache(None)
+
+
+def _key_for(V):
+    return function_key(exotic.T_exotic, (np.zeros(3), V, None, 1.0), {})
+
+
+def test_lambdas_are_keyed_on_their_code_and_closure():
+    σ = 2.0
+    assert _key_for(lambda ϕ: ϕ**2) == _key_for(lambda ϕ: ϕ**2)
+    assert _key_for(lambda ϕ: ϕ**2) != _key_for(lambda ϕ: ϕ**3)
+    assert _key_for(lambda ϕ: ϕ/σ) != _key_for(lambda ϕ: np.cos(ϕ)/σ)
+
+    def scaled(s):
+        return lambda ϕ: ϕ/s
+    assert _key_for(scaled(1.0)) != _key_for(scaled(2.0))
+
+
+def test_reregistered_potential_is_not_served_stale(cache):
+    ϕ = np.linspace(-1, 1, 11)
+    try:
+        exotic.register_potential('x', lambda ϕ, σ: ϕ**2,
+                                  lambda ϕ, σ: 2*ϕ)
+        first = np.array(exotic.phase_diagram(['x'], [1.0], [1.0], ϕ))
+        exotic.register_potential('x', lambda ϕ, σ: ϕ**4,
+                                  lambda ϕ, σ: 4*ϕ**3)
+        second = np.array(exotic.phase_diagram(['x'], [1.0], [1.0], ϕ))
+    finally:
+        exotic.potentials.pop('x', None)
+    np.testing.assert_allclose(second[0, 0, 0], -(8*ϕ**6 - ϕ**4))
+    assert not np.allclose(first, second)
+
+
+def test_cache_does_not_import_the_figure_cli():
+    code = ("import sys, fpit.result_cache; "
+            "print(sorted({'fpit.figures', 'argparse', 'multiprocessing'}"
+            " & set(sys.modules)))")
+    out = subprocess.run([sys.executable, '-c', code], check=True,
+                         capture_output=True, text=True, cwd=SRC_DIR).stdout
+    assert out.strip() == '[]'
+
+
+def test_concurrent_writers_of_one_key_all_succeed(tmp_path):
+    from concurrent.futures import ThreadPoolExecutor
+    store = ResultCache(tmp_path)
+    value = np.arange(1000.0)
+    with ThreadPoolExecutor(8) as pool:
+        list(pool.map(lambda _: store.put('ab' + 'c'*62, value), range(32)))
+    np.testing.assert_array_equal(store.get('ab' + 'c'*62), value)
+    assert not [p for p in (tmp_path / 'ab').iterdir()
+                if p.name.startswith('.tmp-')]
+
+
+def test_put_over_an_existing_entry_keeps_it(tmp_path):
+    store = ResultCache(tmp_path)
+    store.put('ab' + 'd'*62, np.ones(3))
+    store.put('ab' + 'd'*62, np.ones(3))
+    np.testing.assert_array_equal(store.get('ab' + 'd'*62), np.ones(3))
+
+
+def test_none_results_are_cached(cache):
+    calls = []
+
+    @cached
+    def nothing(x):
+        calls.append(x)
+
+    assert nothing(1) is None
+    assert nothing(1) is None
+    assert calls == [1]
+    assert cache.get('missing', 'default') == 'default'
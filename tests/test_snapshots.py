@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from fpit.snapshots import SnapshotWriter, read_snapshots
+from fpit.weak_coupling_critical_phase import (simulate_delta_h,
+                                               simulate_delta_h_nd)
+
+
+class _Crash(SnapshotWriter):
+    """Writer that interrupts the run after `stop_at` steps"""
+
+    def __init__(self, path, stop_at, **kwargs):
+        super().__init__(path, **kwargs)
+        self.stop_at = stop_at
+
+    def record(self, step, t, h):
+        super().record(step, t, h)
+        if step == self.stop_at:
+            raise KeyboardInterrupt
+
+
+def test_resume_after_crash_matches_uninterrupted_run(tmp_path):
+    _, expected = simulate_delta_h(1.0)
+    with pytest.raises(KeyboardInterrupt), \
+            _Crash(tmp_path, 500, every=100, checkpoint_every=300) as w:
+        simulate_delta_h(1.0, snapshots=w)
+    with SnapshotWriter(tmp_path, every=100, checkpoint_every=300) as w:
+        _, h = simulate_delta_h(1.0, snapshots=w)
+    np.testing.assert_array_equal(h, expected)
+    steps, _, frames = read_snapshots(tmp_path)
+    assert list(steps) == list(range(0, 1001, 100))
+    np.testing.assert_array_equal(frames[-1], expected)
+
+
+def test_checkpoint_of_another_coupling_is_rejected(tmp_path):
+    with SnapshotWriter(tmp_path) as w:
+        simulate_delta_h(0.5, snapshots=w)
+    with SnapshotWriter(tmp_path) as w, \
+            pytest.raises(ValueError, match="lambda_val"):
+        simulate_delta_h(1.5, snapshots=w)
+
+
+def test_checkpoint_of_another_dtype_is_rejected(tmp_path):
+    with SnapshotWriter(tmp_path) as w:
+        simulate_delta_h(0.5, snapshots=w)
+    with SnapshotWriter(tmp_path) as w, \
+            pytest.raises(ValueError, match="dtype"):
+        simulate_delta_h(0.5, snapshots=w, dtype=np.float32)
+
+
+def test_nd_checkpoint_of_another_operator_is_rejected(tmp_path):
+    with SnapshotWriter(tmp_path) as w:
+        simulate_delta_h_nd(1.0, ndim=2, n=8, snapshots=w)
+    with SnapshotWriter(tmp_path) as w, \
+            pytest.raises(ValueError, match="operator"):
+        simulate_delta_h_nd(1.0, ndim=2, n=8, operator='sparse', snapshots=w)
+
+
+def test_finished_run_resumes_at_its_end(tmp_path):
+    with SnapshotWriter(tmp_path) as w:
+        _, first = simulate_delta_h(0.5, snapshots=w)
+    with SnapshotWriter(tmp_path) as w:
+        _, again = simulate_delta_h(0.5, snapshots=w)
+    np.testing.assert_array_equal(again, first)
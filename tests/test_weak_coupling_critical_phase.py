@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+
+from fpit.weak_coupling_critical_phase import (_fused_loop,
+                                               integrate_delta_h_cn,
+                                               integrate_delta_h_euler,
+                                               simulate_delta_h, dt, phi0,
+                                               sigma, steps)
+
+
+def _problem(lambda_val, n=100):
+    x = np.linspace(-5*sigma, 5*sigma, n)
+    phi = phi0 * np.exp(-x**2 / sigma**2)
+    h0 = 0.1 * np.exp(-x**2 / (2*sigma)**2)
+    return x, h0, lambda_val * phi**2, np.sqrt(lambda_val) * phi0**2 / sigma
+
+
+@pytest.mark.parametrize('lambda_val', [0.1, 1.0, 2.5])
+def test_fused_kernel_matches_laplace_update(lambda_val):
+    from scipy.ndimage import laplace
+    x, h, coef, Gamma = _problem(lambda_val)
+    for _ in range(steps):
+        h += dt * (-Gamma * h + coef * laplace(h, mode='reflect'))
+    _, fused = simulate_delta_h(lambda_val)
+    np.testing.assert_allclose(fused, h, rtol=0, atol=1e-12 * np.abs(h).max())
+
+
+def test_float32_kernel_stays_close_to_float64():
+    _, h64 = simulate_delta_h(1.0)
+    _, h32 = simulate_delta_h(1.0, dtype=np.float32)
+    assert h32.dtype == np.float32
+    assert np.abs(h32 - h64).max() < 1e-4 * np.abs(h64).max()
+
+
+def test_numpy_kernel_matches_the_loop_numba_compiles():
+    _, h0, coef, Gamma = _problem(1.0, n=20)
+    c = coef * dt
+    diag = (1 - dt*Gamma) - 2*c
+    diag[[0, -1]] += c[[0, -1]]
+    expected = _fused_loop(h0.copy(), np.empty_like(h0), c, diag, 50)
+    h = integrate_delta_h_euler(h0, coef, Gamma, 50)
+    np.testing.assert_allclose(h, expected, rtol=1e-13)
+
+
+@pytest.mark.parametrize('dtype', [np.float64, np.float32])
+def test_numba_kernel_matches_numpy_kernel(dtype):
+    pytest.importorskip('numba')
+    _, h0, coef, Gamma = _problem(1.0)
+    h0 = h0.astype(dtype)
+    expected = integrate_delta_h_euler(h0, coef, Gamma, steps)
+    h = integrate_delta_h_euler(h0, coef, Gamma, steps, kernel='numba')
+    assert h.dtype == dtype
+    np.testing.assert_allclose(h, expected, rtol=1e-5 if dtype == np.float32
+                               else 1e-12)
+
+
+def test_unknown_kernel_is_rejected():
+    _, h0, coef, Gamma = _problem(1.0)
+    with pytest.raises(ValueError, match="Unknown kernel"):
+        integrate_delta_h_euler(h0, coef, Gamma, 1, kernel='cuda')
+
+
+@pytest.mark.parametrize('lambda_val', [1.5, 50.0])
+def test_cn_integrates_decay_to_t_end(lambda_val):
+    _, h0, coef, Gamma = _problem(lambda_val)
+    h, t, _ = integrate_delta_h_cn(h0, coef, Gamma, t_end=steps*dt)
+    assert t == pytest.approx(steps*dt)
+    # Euler at dt/100 as the reference solution
+    ref = integrate_delta_h_euler(h0, coef, Gamma, 100*steps, step=dt/100)
+    assert np.abs(h - ref).max() < 1e-2 * np.abs(ref).max() + 1e-9
+
+
+@pytest.mark.parametrize('lambda_val', [1.5, 10.0, 50.0])
+def test_cn_agrees_with_euler(lambda_val):
+    _, euler = simulate_delta_h(lambda_val)
+    _, cn = simulate_delta_h(lambda_val, method='cn')
+    # Within Euler's own O(dt) error, and CN's absolute tolerance
+    assert np.abs(cn - euler).max() < 0.1 * np.abs(euler).max() + 1e-9